@@ -2,31 +2,50 @@ import cv2
 import mediapipe as mp
 import json
 import os
+import threading
 from datetime import datetime
 
 class MotionCapture:
-    def __init__(self):
+    def __init__(self, buffer_size=1):
+        # Frames the driver may queue ahead of us; 1 keeps the preview at the newest frame
+        self.buffer_size = buffer_size
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
         self.mp_drawing = mp.solutions.drawing_utils
         self.animations_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'animations')
         os.makedirs(self.animations_dir, exist_ok=True)
+        # Set by stop() to end a running capture_motion() from another thread
+        self._stop_event = threading.Event()
 
     def capture_motion(self):
         """
         Opens webcam, tracks pose, records when 'r' pressed, saves on 's' or stop.
         """
+        self._stop_event.clear()
         cap = cv2.VideoCapture(0)
         if not cap.isOpened():
             print("Cannot open webcam")
             return None
+        if self.buffer_size and not cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size):
+            print(f"Warning: camera backend ignored buffer size {self.buffer_size}; preview may lag")
 
+        try:
+            return self._capture_loop(cap)
+        finally:
+            cap.release()
+            cv2.destroyAllWindows()
+
+    def stop(self):
+        """Ask a running capture_motion() to return (without saving) after the current frame."""
+        self._stop_event.set()
+
+    def _capture_loop(self, cap):
         recording = False
         frames = []
 
         print("Press 'r' to start/stop recording, 'q' to quit and save")
 
-        while cap.isOpened():
+        while cap.isOpened() and not self._stop_event.is_set():
             ret, frame = cap.read()
             if not ret:
                 break
@@ -74,8 +93,6 @@ class MotionCapture:
             elif key == ord('q'):
                 break
 
-        cap.release()
-        cv2.destroyAllWindows()
         return None
 
 if __name__ == "__main__":
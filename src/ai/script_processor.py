@@ -5,8 +5,10 @@ Parses text to extract scenes, camera angles, lighting, and object descriptions
 
 import re
 import json
+import hashlib
+from collections import OrderedDict
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,6 +49,10 @@ class ScriptProcessor:
     for Blender rendering
     """
     
+    # Parsed scenes per script (SHA-1 of the text), shared by all processors, oldest evicted first
+    PARSE_CACHE_SIZE = 128
+    _parse_cache: "OrderedDict[str, tuple]" = OrderedDict()
+    
     # Keywords for scene detection
     SCENE_KEYWORDS = ['scene', 'location', 'setting', 'place', 'room', 'area', 'environment']
     CAMERA_KEYWORDS = {
@@ -83,6 +89,13 @@ class ScriptProcessor:
         Returns:
             Dictionary with scene configuration for Blender
         """
+        key = self._cache_key(script)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            self.scenes = self._copy_scenes(cached)
+            return self._serialize_scenes_config()
+        
         self.scenes = []
         
         # Split script into sentences/paragraphs
@@ -105,9 +118,23 @@ class ScriptProcessor:
                 lighting='soft'
             ))
         
+        self._parse_cache[key] = tuple(self._copy_scenes(self.scenes))
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        
         # Return structured configuration
         return self._serialize_scenes_config()
     
+    @staticmethod
+    def _cache_key(script: str) -> str:
+        """Key for the parse cache"""
+        return hashlib.sha1(script.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _copy_scenes(scenes) -> List[Scene]:
+        """Copies of scenes (and their object lists) so cached parses are never shared"""
+        return [replace(scene, objects=[replace(obj) for obj in scene.objects]) for scene in scenes]
+    
     def _parse_paragraph_to_scene(self, paragraph: str, scene_id: int) -> Optional[Scene]:
         """Parse a paragraph into a scene"""
         
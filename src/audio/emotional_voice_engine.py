@@ -33,12 +33,13 @@ class EmotionalVoiceEngine:
         'whisper': {'pitch': 0.7, 'rate': 100, 'volume': 0.5},
     }
 
-    def __init__(self, audio_dir: Optional[str] = None):
+    def __init__(self, audio_dir: Optional[str] = None, fast: bool = False):
         """
         Initialize the emotional voice engine.
         
         Args:
             audio_dir: Directory to store audio files
+            fast: Trade some pitch-shift quality for speed (quick resampler)
         """
         if audio_dir is None:
             audio_dir = os.path.join(
@@ -49,6 +50,10 @@ class EmotionalVoiceEngine:
         self.audio_dir = audio_dir
         os.makedirs(self.audio_dir, exist_ok=True)
         
+        # Resampling inside librosa's pitch shift dominates emotional post-processing
+        self.fast = fast
+        self._pitch_res_type = 'soxr_qq' if fast else 'soxr_hq'
+        
         # Initialize pyttsx3 engines for different voices
         self.engines = {}
         self._init_engines()
@@ -128,6 +133,59 @@ class EmotionalVoiceEngine:
             logger.error(f"Error generating emotional voice: {e}")
             raise
 
+    def generate_emotional_voice_batch(self, text: str, emotions: List[str],
+                                      voice_variant: str = 'voice_0',
+                                      filenames: Optional[List[str]] = None) -> List[str]:
+        """
+        Generate the same text in several emotions with a single TTS run.
+        
+        Every emotion's rate change and save command is queued on one engine
+        and the queue is drained by a single runAndWait(), instead of starting
+        the speech driver's event loop once per emotion.
+        
+        Args:
+            text: Text to convert to speech
+            emotions: Emotion types (see EMOTION_PRESETS keys)
+            voice_variant: Which voice to use
+            filenames: Output filenames, one per emotion
+        
+        Returns:
+            Paths to generated audio files, in the order of emotions
+        """
+        if filenames is not None and len(filenames) != len(emotions):
+            raise ValueError("filenames must match emotions one-to-one")
+        
+        emotions = [e if e in self.EMOTION_PRESETS else 'neutral' for e in emotions]
+        if filenames is None:
+            from datetime import datetime
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filenames = [f"voice_{emotion}_{timestamp}_{i}.wav" for i, emotion in enumerate(emotions)]
+        filepaths = [os.path.join(self.audio_dir, name) for name in filenames]
+        
+        try:
+            if voice_variant in self.engines:
+                engine = self.engines[voice_variant]['engine']
+                if 'voice_id' in self.engines[voice_variant]:
+                    engine.setProperty('voice', self.engines[voice_variant]['voice_id'])
+            else:
+                engine = pyttsx3.init()
+            
+            # setProperty/save_to_file only queue commands; runAndWait executes them in order
+            for emotion, filepath in zip(emotions, filepaths):
+                engine.setProperty('rate', self.EMOTION_PRESETS[emotion]['rate'])
+                engine.save_to_file(text, filepath)
+            engine.runAndWait()
+            
+            for emotion, filepath in zip(emotions, filepaths):
+                self._apply_emotional_processing(filepath, self.EMOTION_PRESETS[emotion])
+            
+            logger.info(f"Generated {len(filepaths)} emotional voices in one batch")
+            return filepaths
+            
+        except Exception as e:
+            logger.error(f"Error generating emotional voice batch: {e}")
+            raise
+
     def _apply_emotional_processing(self, filepath: str, emotion_config: dict):
         """
         Apply pitch and volume adjustments to audio file.
@@ -145,7 +203,8 @@ class EmotionalVoiceEngine:
             if pitch_factor != 1.0:
                 # Pitch shift in semitones (1.2x pitch ≈ 3.86 semitones)
                 semitones = 12 * np.log2(pitch_factor)
-                y = librosa.effects.pitch_shift(y, sr=sr, n_steps=semitones)
+                y = librosa.effects.pitch_shift(y, sr=sr, n_steps=semitones,
+                                                res_type=self._pitch_res_type)
             
             # Apply volume adjustment
             volume_factor = emotion_config['volume']
@@ -258,12 +317,13 @@ class EmotionalVoiceEngine:
         Returns:
             Compressed audio segment
         """
-        # Convert to numpy array
+        # Convert to numpy array; everything below scales this one buffer in place
         samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
-        samples = samples / np.iinfo(np.int16).max
+        full_scale = np.float32(np.iinfo(np.int16).max)
+        samples /= full_scale
         
         # Calculate RMS
-        rms = np.sqrt(np.mean(samples**2))
+        rms = np.sqrt(np.dot(samples, samples) / max(samples.size, 1))
         db = 20 * np.log10(rms + 1e-10)
         
         # Apply compression
@@ -271,10 +331,11 @@ class EmotionalVoiceEngine:
             excess = db - threshold_db
             reduction = excess * (1 - 1/ratio)
             gain_linear = 10 ** (-reduction / 20)
-            samples = samples * gain_linear
+            samples *= np.float32(gain_linear)
         
         # Convert back
-        samples = np.clip(samples, -1, 1) * np.iinfo(np.int16).max
+        np.clip(samples, -1, 1, out=samples)
+        samples *= full_scale
         
         return audio._spawn(samples.astype(np.int16).tobytes())
 
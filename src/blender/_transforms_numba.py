@@ -0,0 +1,62 @@
+"""
+Batched TRS transform construction for scene placements.
+Compiled with Numba when it is installed, otherwise falls back to vectorized NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def build_transforms(pos, rot, scl, out):
+        """
+        Fill out[i] with the 4x4 world matrix T @ Rz @ Ry @ Rx @ S for every
+        placement, matching Blender's default XYZ Euler rotation order.
+        """
+        for i in prange(pos.shape[0]):
+            cx, sx = np.cos(rot[i, 0]), np.sin(rot[i, 0])
+            cy, sy = np.cos(rot[i, 1]), np.sin(rot[i, 1])
+            cz, sz = np.cos(rot[i, 2]), np.sin(rot[i, 2])
+            kx, ky, kz = scl[i, 0], scl[i, 1], scl[i, 2]
+
+            out[i, 0, 0] = cz * cy * kx
+            out[i, 0, 1] = (cz * sy * sx - sz * cx) * ky
+            out[i, 0, 2] = (cz * sy * cx + sz * sx) * kz
+            out[i, 0, 3] = pos[i, 0]
+            out[i, 1, 0] = sz * cy * kx
+            out[i, 1, 1] = (sz * sy * sx + cz * cx) * ky
+            out[i, 1, 2] = (sz * sy * cx - cz * sx) * kz
+            out[i, 1, 3] = pos[i, 1]
+            out[i, 2, 0] = -sy * kx
+            out[i, 2, 1] = cy * sx * ky
+            out[i, 2, 2] = cy * cx * kz
+            out[i, 2, 3] = pos[i, 2]
+            out[i, 3, 0] = 0.0
+            out[i, 3, 1] = 0.0
+            out[i, 3, 2] = 0.0
+            out[i, 3, 3] = 1.0
+else:
+    def build_transforms(pos, rot, scl, out):
+        """NumPy equivalent of the compiled kernel, evaluated over all placements at once."""
+        cx, cy, cz = np.cos(rot).T
+        sx, sy, sz = np.sin(rot).T
+        kx, ky, kz = scl.T
+
+        out[:, 0, 0] = cz * cy * kx
+        out[:, 0, 1] = (cz * sy * sx - sz * cx) * ky
+        out[:, 0, 2] = (cz * sy * cx + sz * sx) * kz
+        out[:, 1, 0] = sz * cy * kx
+        out[:, 1, 1] = (sz * sy * sx + cz * cx) * ky
+        out[:, 1, 2] = (sz * sy * cx - cz * sx) * kz
+        out[:, 2, 0] = -sy * kx
+        out[:, 2, 1] = cy * sx * ky
+        out[:, 2, 2] = cy * cx * kz
+        out[:, :3, 3] = pos
+        out[:, 3, :3] = 0.0
+        out[:, 3, 3] = 1.0
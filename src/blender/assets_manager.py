@@ -1,12 +1,16 @@
 import os
-from google import genai
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
-if api_key:
-    client = genai.Client(api_key=api_key)
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Create the GenAI client on first mood detection rather than at import."""
+    from google import genai
+    return genai.Client(api_key=api_key)
 
 # Asset directories
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
@@ -74,7 +78,7 @@ def detect_mood(script):
         return 'Neutral'
     prompt = f"Analyze this script and determine the overall mood/emotion. Return only one word: Dark, Bright, Intense, Divine, Neutral, etc.\n\nScript: {script}"
     try:
-        response = client.models.generate_content(model='gemini-1.5-pro', contents=prompt)
+        response = _get_client().models.generate_content(model='gemini-1.5-pro', contents=prompt)
         mood = response.text.strip().split()[0]  # Take first word
         return mood
     except:
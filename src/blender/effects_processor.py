@@ -135,13 +135,16 @@ bpy.context.scene.frame_end = int({duration} * 24)
 """
     return code
 
-def process_effects(bpy_code, script, audio_path, mood, duration, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
-    """Process and add effects to bpy_code."""
+def generate_effects_code(script, audio_path, mood, duration, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
+    """Return the list of effect snippets (particles, watermark, export) for a scene."""
     effects = detect_effects(script)
     particle_code = generate_particle_code(effects)
     watermark_code = add_watermark_code()
     music_path = generate_music(mood, duration) if mood and enable_bgm else None
     export_code = enhance_export_code(audio_path, music_path, duration, voice_volume, bgm_volume)
+    return [particle_code, watermark_code, export_code]
 
-    bpy_code += "\n\n" + particle_code + "\n\n" + watermark_code + "\n\n" + export_code
-    return bpy_code
\ No newline at end of file
+def process_effects(bpy_code, script, audio_path, mood, duration, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
+    """Process and add effects to bpy_code."""
+    effect_parts = generate_effects_code(script, audio_path, mood, duration, enable_bgm, voice_volume, bgm_volume)
+    return "\n\n".join([bpy_code, *effect_parts])
\ No newline at end of file
@@ -4,15 +4,21 @@ Integrates with Blender's Python API and command-line rendering
 """
 
 import os
+import shutil
 import subprocess
+import tempfile
 import json
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import logging
 import sys
 
 logger = logging.getLogger(__name__)
 
+# Concurrent Blender processes for render_parallel; each one loads the whole scene,
+# so keep this low on 8 GB machines
+PARALLEL_RENDER_WORKERS = 2
+
 
 class BlenderRenderer:
     """
@@ -209,7 +215,8 @@ print(f"Rendering complete: {{output_path}}")
         return None
     
     def render_to_video(self, blend_file: str, output_dir: str,
-                       fps: int = 30) -> Optional[str]:
+                       fps: int = 30, frame_start: Optional[int] = None,
+                       frame_end: Optional[int] = None) -> Optional[str]:
         """
         Render an existing Blender file to video
         
@@ -217,7 +224,9 @@ print(f"Rendering complete: {{output_path}}")
             blend_file: Path to .blend file
             output_dir: Output directory
             fps: Frames per second
-            
+            frame_start: First frame (default: the scene's own frame_start)
+            frame_end: Last frame, inclusive (default: the scene's own frame_end)
+        
         Returns:
             Path to rendered video
         """
@@ -225,6 +234,16 @@ print(f"Rendering complete: {{output_path}}")
         
         output_path = os.path.join(output_dir, "rendered_scene.mp4")
         
+        if frame_start is None or frame_end is None:
+            scene_range = self._read_frame_range(blend_file)
+            if scene_range is not None:
+                frame_start = scene_range[0] if frame_start is None else frame_start
+                frame_end = scene_range[1] if frame_end is None else frame_end
+        
+        if frame_start is not None and frame_end is not None:
+            return self.render_parallel(blend_file, output_path, frame_start, frame_end)
+        
+        # The frame range could not be read; let a single Blender render the whole scene
         try:
             cmd = [
                 self.blender_path,
@@ -241,7 +260,179 @@ print(f"Rendering complete: {{output_path}}")
             logger.error(f"Error rendering blend file: {e}")
         
         return None
-
+        
+    def _read_frame_range(self, blend_file: str) -> Optional[Tuple[int, int]]:
+        """
+        Ask Blender for the scene's frame range
+        
+        Args:
+            blend_file: Path to .blend file
+        
+        Returns:
+            (frame_start, frame_end), or None if Blender could not report it
+        """
+        expr = ("import bpy; s = bpy.context.scene; "
+                "print('FRAME_RANGE', s.frame_start, s.frame_end)")
+        try:
+            result = subprocess.run(
+                [self.blender_path, '-b', blend_file, '--python-expr', expr],
+                capture_output=True, text=True, timeout=60
+            )
+        except Exception as e:
+            logger.warning(f"Could not read frame range from {blend_file}: {e}")
+            return None
+        
+        for line in result.stdout.splitlines():
+            if line.startswith('FRAME_RANGE '):
+                _, start, end = line.split()
+                return int(start), int(end)
+        logger.warning(f"Blender reported no frame range for {blend_file}")
+        return None
+    
+    @staticmethod
+    def _split_frame_range(frame_start: int, frame_end: int, workers: int) -> List[Tuple[int, int]]:
+        """
+        Split an inclusive frame range into contiguous chunks
+        
+        The remainder is spread over the first chunks, so sizes differ by at most one frame.
+        
+        Args:
+            frame_start: First frame
+            frame_end: Last frame (inclusive)
+            workers: Number of chunks
+        
+        Returns:
+            List of inclusive (start, end) pairs covering the range in order
+        """
+        base, extra = divmod(frame_end - frame_start + 1, workers)
+        ranges = []
+        start = frame_start
+        for i in range(workers):
+            end = start + base + (1 if i < extra else 0) - 1
+            ranges.append((start, end))
+            start = end + 1
+        return ranges
+    
+    def render_parallel(self, blend_file: str, output_path: str,
+                        frame_start: int, frame_end: int,
+                        workers: Optional[int] = None,
+                        with_audio: bool = True) -> Optional[str]:
+        """
+        Render a frame range as N concurrent Blender processes and join the parts
+        
+        Each process renders its own chunk of frames to an mp4 part; the parts
+        are concatenated with ffmpeg (stream copy, no re-encode). The sound
+        strips are mixed down once by a separate Blender process running
+        alongside the chunks and muxed in at the end.
+        
+        Args:
+            blend_file: Path to .blend file
+            output_path: Path of the final video
+            frame_start: First frame to render
+            frame_end: Last frame to render (inclusive)
+            workers: Number of Blender processes (default: PARALLEL_RENDER_WORKERS)
+            with_audio: Mix down and attach the scene's audio
+        
+        Returns:
+            Path to rendered video, or None if any chunk failed
+        
+        Raises:
+            ValueError: If frame_end is before frame_start
+        """
+        if frame_end < frame_start:
+            raise ValueError(f"frame_end ({frame_end}) is before frame_start ({frame_start})")
+        
+        total = frame_end - frame_start + 1
+        cores = os.cpu_count() or 1
+        workers = max(1, min(workers or PARALLEL_RENDER_WORKERS, total))
+        # Split the cores between the processes instead of each Blender using all of them
+        threads = max(1, cores // workers)
+        parts_dir = tempfile.mkdtemp(prefix="parallel_", dir=self.temp_dir)
+        
+        try:
+            return self._render_parallel_in(parts_dir, blend_file, output_path,
+                                            frame_start, frame_end, workers, threads, with_audio)
+        finally:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+    
+    def _render_parallel_in(self, parts_dir: str, blend_file: str, output_path: str,
+                            frame_start: int, frame_end: int, workers: int, threads: int,
+                            with_audio: bool) -> Optional[str]:
+        """Body of render_parallel, working inside a fresh parts_dir"""
+        ranges = self._split_frame_range(frame_start, frame_end, workers)
+        
+        logger.info(f"Rendering frames {frame_start}-{frame_end} in {workers} chunks "
+                    f"({threads} threads each)")
+        
+        # -F only picks FFMPEG; the container comes from the .blend (Matroska by default),
+        # so pin every part to H.264 in MP4 for the stream-copy join
+        container = ("import bpy; ff = bpy.context.scene.render.ffmpeg; "
+                     "ff.format = 'MPEG4'; ff.codec = 'H264'")
+        procs = []
+        for i, (s, e) in enumerate(ranges):
+            # -a must come last: Blender applies its arguments in order
+            cmd = [
+                self.blender_path, '-b', blend_file, '-noaudio', '-t', str(threads),
+                '-o', os.path.join(parts_dir, f"part_{i:03d}_"),
+                '-F', 'FFMPEG', '-x', '1', '--python-expr', container,
+                '-s', str(s), '-e', str(e), '-a'
+            ]
+            procs.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        
+        audio_path = os.path.join(parts_dir, "mixdown.wav")
+        audio_proc = None
+        if with_audio:
+            mixdown = (
+                "import bpy; bpy.ops.sound.mixdown("
+                f"filepath={audio_path!r}, container='WAV', codec='PCM')"
+            )
+            audio_proc = subprocess.Popen(
+                [self.blender_path, '-b', blend_file, '-t', '1', '--python-expr', mixdown],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        
+        failed = [i for i, p in enumerate(procs) if p.wait() != 0]
+        has_audio = (audio_proc is not None and audio_proc.wait() == 0
+                     and os.path.exists(audio_path))
+        if failed:
+            logger.error(f"Blender failed on chunks {failed}")
+            return None
+        
+        # Blender appends the frame range and extension to each prefix; parts_dir is
+        # private to this run, so each chunk's prefix matches exactly one file
+        parts = []
+        for i in range(len(ranges)):
+            found = sorted(Path(parts_dir).glob(f"part_{i:03d}_*"))
+            if not found:
+                logger.error(f"Blender produced no video for chunk {i}")
+                return None
+            parts.append(str(found[0]))
+        
+        concat_list = os.path.join(parts_dir, "concat.txt")
+        with open(concat_list, 'w') as f:
+            f.writelines(f"file '{Path(p).as_posix()}'\n" for p in parts)
+        
+        video_path = os.path.join(parts_dir, "video.mp4")
+        result = subprocess.run(['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', concat_list,
+                                 '-c', 'copy', video_path], capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.error(f"ffmpeg could not join the rendered chunks: {result.stderr}")
+            return None
+        
+        if has_audio:
+            result = subprocess.run(['ffmpeg', '-y', '-i', video_path, '-i', audio_path,
+                                     '-map', '0:v', '-map', '1:a', '-c:v', 'copy', '-c:a', 'aac',
+                                     '-shortest', output_path], capture_output=True, text=True)
+            if result.returncode != 0:
+                logger.error(f"ffmpeg could not add the audio track: {result.stderr}")
+                return None
+        else:
+            if with_audio:
+                logger.warning("Audio mixdown failed; writing video without sound")
+            shutil.move(video_path, output_path)
+        
+        logger.info(f"Video rendered successfully: {output_path}")
+        return output_path
 
 def render_scene(scene_description):
     """Legacy compatibility function"""
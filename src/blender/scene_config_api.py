@@ -122,6 +122,7 @@ class SceneConfigAPI:
                 scene.background_color = tuple(data['background_color'])
             if 'ambient_light_strength' in data:
                 scene.ambient_light_strength = data['ambient_light_strength']
+            scene.invalidate_info()
             
             return jsonify({
                 'success': True,
@@ -1,26 +1,42 @@
 import subprocess
 import os
+import json
+import string
 import tempfile
 import uuid
-import librosa
 import numpy as np
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 
-def generate_armature_code(motion_capture_path, duration):
+# Command lines up to this length pass the script inline via --python-expr; longer
+# ones pipe it through stdin. Windows caps the whole command line at 32,767 chars.
+INLINE_SCRIPT_LIMIT = 30_000
+STDIN_BOOTSTRAP = "import sys; exec(compile(sys.stdin.read(), '<srijan>', 'exec'))"
+
+def run_blender_script(blender_path, bpy_code, extra_args=()):
     """
-    Generates bpy code to create armature and apply motion capture poses.
+    Runs bpy_code in a background Blender process without writing a temp script.
     """
-    code = f"""
+    cmd = [blender_path, "--background", "--python-expr", bpy_code, *extra_args]
+    # Measure the quoted form: escaping the script's quotes can grow it on Windows
+    if len(subprocess.list2cmdline(cmd)) < INLINE_SCRIPT_LIMIT:
+        return subprocess.run(cmd)
+    cmd = [blender_path, "--background", "--python-expr", STDIN_BOOTSTRAP, *extra_args]
+    return subprocess.run(cmd, input=bpy_code.encode('utf-8'))
+
+# MediaPipe Pose landmarks driving the armature:
+# left shoulder, right shoulder, left hip, right hip
+MOCAP_JOINTS = [11, 12, 23, 24]
+
+# Static bpy snippets are parsed once at import and filled per call with
+# Template.substitute rather than rebuilt as f-strings on every scene.
+ARMATURE_TEMPLATE = string.Template("""
 # Motion Capture Armature
 import bpy
-import json
+import numpy as np
 
-# Load motion data
-with open('{motion_capture_path}', 'r') as f:
-    data = json.load(f)
-frames = data['frames']
-fps = data.get('fps', 30)
+# Load motion data: (frames, joint, xyz) float32, joints ordered as MOCAP_JOINTS
+frames = np.load(r'${frames_path}')
 
 # Create simple armature
 bpy.ops.object.armature_add(location=(0, 0, 0))
@@ -66,69 +82,31 @@ bpy.ops.object.mode_set(mode='POSE')
 pose_bones = armature.pose.bones
 
 scene_fps = 24
-motion_frames = len(frames)
-duration_frames = int({duration} * scene_fps)
+duration_frames = int(${duration} * scene_fps)
+
+# Loop motion if shorter: one index vector, one gather -> (duration_frames, joint, xyz)
+idx = np.mod(np.arange(duration_frames), frames.shape[0])
+selected = frames[idx]
+
+# Simplified pose mapping (scale normalized coords)
+scale = 2.0  # Adjust scale
+hips_loc = ((selected[:, 2] + selected[:, 3]) * 0.5 * scale - np.array([scale / 2, scale / 2, 0.0])).tolist()
+left_shoulder_loc = ((selected[:, 0] - np.array([0.5, 0.5, 0.0])) * scale).tolist()
+right_shoulder_loc = ((selected[:, 1] - np.array([0.5, 0.5, 0.0])) * scale).tolist()
 
 for i in range(duration_frames):
     frame_num = i + 1
-    bpy.context.scene.frame_set(frame_num)
-    
-    # Loop motion if shorter
-    motion_idx = i % motion_frames
-    frame_data = frames[motion_idx]
-    
-    # Simplified pose mapping (scale normalized coords)
-    scale = 2.0  # Adjust scale
-    if len(frame_data) > 23:  # MediaPipe has 33
-        # Hips from left_hip (23) and right_hip (24)
-        left_hip = frame_data[23]
-        right_hip = frame_data[24]
-        hips_x = (left_hip[0] + right_hip[0]) / 2 * scale - scale/2
-        hips_y = (left_hip[1] + right_hip[1]) / 2 * scale - scale/2
-        hips_z = (left_hip[2] + right_hip[2]) / 2 * scale
-        pose_bones['Hips'].location = (hips_x, hips_y, hips_z)
-        pose_bones['Hips'].keyframe_insert(data_path='location', frame=frame_num)
-        
-        # Shoulders
-        if len(frame_data) > 11:
-            left_shoulder_lm = frame_data[11]  # left_shoulder
-            right_shoulder_lm = frame_data[12]  # right_shoulder
-            pose_bones['LeftShoulder'].location = ((left_shoulder_lm[0] - 0.5) * scale, (left_shoulder_lm[1] - 0.5) * scale, (left_shoulder_lm[2]) * scale)
-            pose_bones['RightShoulder'].location = ((right_shoulder_lm[0] - 0.5) * scale, (right_shoulder_lm[1] - 0.5) * scale, (right_shoulder_lm[2]) * scale)
-            pose_bones['LeftShoulder'].keyframe_insert(data_path='location', frame=frame_num)
-            pose_bones['RightShoulder'].keyframe_insert(data_path='location', frame=frame_num)
+    pose_bones['Hips'].location = hips_loc[i]
+    pose_bones['Hips'].keyframe_insert(data_path='location', frame=frame_num)
+    pose_bones['LeftShoulder'].location = left_shoulder_loc[i]
+    pose_bones['RightShoulder'].location = right_shoulder_loc[i]
+    pose_bones['LeftShoulder'].keyframe_insert(data_path='location', frame=frame_num)
+    pose_bones['RightShoulder'].keyframe_insert(data_path='location', frame=frame_num)
 
 bpy.ops.object.mode_set(mode='OBJECT')
-"""
-    return code
-
-def analyze_audio(audio_path):
-    """
-    Analyzes the audio file to get duration, RMS energy, and intensity for lip-sync.
-    """
-    y, sr = librosa.load(audio_path)
-    duration = librosa.get_duration(y=y, sr=sr)
-    rms = librosa.feature.rms(y=y)[0]
-    rms = rms / np.max(rms) if np.max(rms) > 0 else rms
-    # Extract intensity as average RMS
-    intensity = np.mean(rms)
-    return duration, rms, intensity
-
-def generate_lip_sync_code(duration, rms, char_name=None, mood=None, intensity=1.0):
-    """
-    Generates Blender Python code for lip-sync animation and expressions.
-    """
-    fps = 24
-    frame_end = int(duration * fps)
-    num_frames = len(rms)
-    step = max(1, num_frames // frame_end)  # Sample rms every few frames
+""")
 
-    if char_name and char_name != 'Basic Head':
-        from .assets_manager import load_character
-        char_code = load_character(char_name)
-        head_creation = char_code
-    else:
-        head_creation = """
+BASIC_HEAD_CODE = """
 # Create a simple head model
 bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, location=(0, 0, 1.5))
 head = bpy.context.active_object
@@ -195,15 +173,15 @@ elif mood == 'Divine':
     divine_shape.value = 1
 """
 
-    code = f"""
+LIP_SYNC_TEMPLATE = string.Template("""
 # Lip-Sync Setup
 import bpy
 
 # Set animation length
-bpy.context.scene.frame_end = {frame_end}
-bpy.context.scene.render.fps = {fps}
+bpy.context.scene.frame_end = ${frame_end}
+bpy.context.scene.render.fps = ${fps}
 
-{head_creation}
+${head_creation}
 
 # Add camera focusing on face
 bpy.ops.object.camera_add(location=(0, -3, 1.5))
@@ -217,10 +195,10 @@ constraint.target = head
 constraint.track_axis = 'TRACK_NEGATIVE_Z'
 
 # Animate shape key based on audio RMS
-rms_data = {rms.tolist()}
-step = {step}
-intensity_factor = {intensity}
-for frame in range(0, {frame_end}, 1):
+rms_data = ${rms_data}
+step = ${step}
+intensity_factor = ${intensity}
+for frame in range(0, ${frame_end}, 1):
     rms_index = min(frame * step, len(rms_data) - 1)
     value = rms_data[rms_index] * intensity_factor
     mouth_shape.value = value
@@ -231,56 +209,118 @@ import random
 random.seed(42)
 blink_times = []
 current_time = 0
-fps = {fps}
-while current_time < {frame_end} / fps:
+fps = ${fps}
+while current_time < ${frame_end} / fps:
     blink_times.append(int(current_time * fps))
     interval = random.uniform(3, 5)
     current_time += interval
 for blink_frame in blink_times:
-    if blink_frame + 3 < {frame_end}:
+    if blink_frame + 3 < ${frame_end}:
         blink_shape.value = 1
         blink_shape.keyframe_insert(data_path='value', frame=blink_frame)
         blink_shape.keyframe_insert(data_path='value', frame=blink_frame + 1)
         blink_shape.value = 0
         blink_shape.keyframe_insert(data_path='value', frame=blink_frame + 2)
-"""
-    return code
+""")
 
-def render_scene(bpy_code, blender_path, audio_path=None, script=None, env_name=None, char_name=None, motion_capture_path=None, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
+def cache_motion_frames(motion_capture_path):
     """
-    Renders the scene using the provided bpy_code and Blender executable.
-    Saves the output as a unique .mp4 file in the output/ folder.
+    Converts a motion capture JSON into a float32 .npy holding only the joints
+    the armature uses, shaped (frames, len(MOCAP_JOINTS), 3).
+    The .npy sits next to the JSON and is rebuilt only when the JSON is newer.
+    """
+    frames_path = os.path.splitext(motion_capture_path)[0] + '_joints.npy'
+    if (not os.path.exists(frames_path)
+            or os.path.getmtime(frames_path) < os.path.getmtime(motion_capture_path)):
+        with open(motion_capture_path, 'r') as f:
+            data = json.load(f)
+        frames = np.asarray(data['frames'], dtype=np.float32)
+        np.save(frames_path, frames[:, MOCAP_JOINTS, :3])
+    return frames_path
+
+def generate_armature_code(motion_capture_path, duration):
+    """
+    Generates bpy code to create armature and apply motion capture poses.
+    """
+    frames_path = cache_motion_frames(motion_capture_path)
+    return ARMATURE_TEMPLATE.substitute(frames_path=frames_path, duration=duration)
+
+def analyze_audio(audio_path):
+    """
+    Analyzes the audio file to get duration, RMS energy, and intensity for lip-sync.
     """
+    # librosa takes about a second to import; only scenes with audio need it
+    import librosa
+    y, sr = librosa.load(audio_path)
+    duration = librosa.get_duration(y=y, sr=sr)
+    rms = librosa.feature.rms(y=y)[0]
+    rms = rms / np.max(rms) if np.max(rms) > 0 else rms
+    # Extract intensity as average RMS
+    intensity = np.mean(rms)
+    return duration, rms, intensity
+
+def generate_lip_sync_code(duration, rms, char_name=None, mood=None, intensity=1.0):
+    """
+    Generates Blender Python code for lip-sync animation and expressions.
+    """
+    fps = 24
+    frame_end = int(duration * fps)
+    num_frames = len(rms)
+    step = max(1, num_frames // frame_end)  # Sample rms every few frames
+
+    if char_name and char_name != 'Basic Head':
+        from .assets_manager import load_character
+        head_creation = load_character(char_name)
+    else:
+        head_creation = BASIC_HEAD_CODE
+
+    return LIP_SYNC_TEMPLATE.substitute(
+        frame_end=frame_end,
+        fps=fps,
+        head_creation=head_creation,
+        rms_data=rms.tolist(),
+        step=step,
+        intensity=intensity,
+    )
+
+def build_scene_parts(bpy_code, audio_path=None, script=None, env_name=None, char_name=None, motion_capture_path=None, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
+    """
+    Collects the bpy snippets for a scene (lighting, environment, lip-sync,
+    effects, armature) into a list so callers can join them once.
+    Returns (parts, duration).
+    """
+    parts = [bpy_code]
     mood = None
     duration = 10  # default
     if script:
         from .assets_manager import detect_mood, get_lighting_for_mood
         mood = detect_mood(script)
-        lighting_code = get_lighting_for_mood(mood)
-        bpy_code += "\n\n" + lighting_code
+        parts.append(get_lighting_for_mood(mood))
 
     if env_name:
         from .assets_manager import load_environment
-        env_code = load_environment(env_name)
-        bpy_code += "\n\n" + env_code
+        parts.append(load_environment(env_name))
 
     if audio_path:
         duration, rms, intensity = analyze_audio(audio_path)
-        lip_sync_code = generate_lip_sync_code(duration, rms, char_name, mood, intensity)
-        bpy_code += "\n\n" + lip_sync_code
+        parts.append(generate_lip_sync_code(duration, rms, char_name, mood, intensity))
 
     # Process effects
-    from .effects_processor import process_effects
-    bpy_code = process_effects(bpy_code, script or "", audio_path, mood, duration, enable_bgm, voice_volume, bgm_volume)
+    from .effects_processor import generate_effects_code
+    parts.extend(generate_effects_code(script or "", audio_path, mood, duration, enable_bgm, voice_volume, bgm_volume))
 
     if motion_capture_path:
-        armature_code = generate_armature_code(motion_capture_path, duration)
-        bpy_code += "\n\n" + armature_code
+        parts.append(generate_armature_code(motion_capture_path, duration))
 
-    # Save bpy_code to a temporary .py file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write(bpy_code)
-        temp_script = f.name
+    return parts, duration
+
+def render_scene(bpy_code, blender_path, audio_path=None, script=None, env_name=None, char_name=None, motion_capture_path=None, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
+    """
+    Renders the scene using the provided bpy_code and Blender executable.
+    Saves the output as a unique .mp4 file in the output/ folder.
+    """
+    parts, duration = build_scene_parts(bpy_code, audio_path, script, env_name, char_name, motion_capture_path, enable_bgm, voice_volume, bgm_volume)
+    bpy_code = "\n\n".join(parts)
 
     # Prepare output path with unique name
     output_dir = os.path.join(BASE_DIR, 'output')
@@ -289,10 +329,7 @@ def render_scene(bpy_code, blender_path, audio_path=None, script=None, env_name=
     output_path = os.path.join(output_dir, unique_name)
 
     # Run portable Blender in background mode with Eevee engine and GPU for speed
-    cmd = [
-        blender_path,
-        "--background",
-        "--python", temp_script,
+    render_args = [
         "--render-output", output_path,
         "--render-format", "FFMPEG",
         "--render-ffmpeg-format", "MPEG4",
@@ -301,55 +338,27 @@ def render_scene(bpy_code, blender_path, audio_path=None, script=None, env_name=
         "--render-engine", "BLENDER_EEVEE",
         "--render-device", "GPU"  # Optimized for speed on capable hardware
     ]
-    subprocess.run(cmd)
+    run_blender_script(blender_path, bpy_code, render_args)
 
     # Auto-open output folder
     os.startfile(output_dir)
 
-    # Clean up temporary script
-    os.unlink(temp_script)
-
     return output_path
 
 def preview_scene(bpy_code, blender_path, audio_path=None, script=None, env_name=None, char_name=None, motion_capture_path=None, enable_bgm=False, voice_volume=1.0, bgm_volume=0.3):
     """
     Renders a quick screenshot of the scene for preview.
     """
-    mood = None
-    duration = 10  # default
-    if script:
-        from .assets_manager import detect_mood, get_lighting_for_mood
-        mood = detect_mood(script)
-        lighting_code = get_lighting_for_mood(mood)
-        bpy_code += "\n\n" + lighting_code
-
-    if env_name:
-        from .assets_manager import load_environment
-        env_code = load_environment(env_name)
-        bpy_code += "\n\n" + env_code
-
-    if audio_path:
-        duration, rms, intensity = analyze_audio(audio_path)
-        lip_sync_code = generate_lip_sync_code(duration, rms, char_name, mood, intensity)
-        bpy_code += "\n\n" + lip_sync_code
-
-    # Process effects
-    from .effects_processor import process_effects
-    bpy_code = process_effects(bpy_code, script or "", audio_path, mood, duration, enable_bgm, voice_volume, bgm_volume)
-
-    if motion_capture_path:
-        armature_code = generate_armature_code(motion_capture_path, duration)
-        bpy_code += "\n\n" + armature_code
+    parts, duration = build_scene_parts(bpy_code, audio_path, script, env_name, char_name, motion_capture_path, enable_bgm, voice_volume, bgm_volume)
 
     # Create temp screenshot path
-    import tempfile
     with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
         screenshot_path = f.name
 
     # Add screenshot code
     fps = 24
     frame_middle = int(duration * fps / 2)
-    bpy_code += f"""
+    parts.append(f"""
 # Set to middle frame
 bpy.context.scene.frame_set({frame_middle})
 
@@ -363,18 +372,11 @@ bpy.context.scene.render.filepath = '{screenshot_path}'
 
 # Render OpenGL screenshot
 bpy.ops.render.opengl(write_still=True)
-"""
+""")
+    bpy_code = "\n\n".join(parts)
 
     # Run portable Blender in background mode for screenshot
-    cmd = [
-        blender_path,
-        "--background",
-        "--python", temp_script,
-    ]
-    subprocess.run(cmd)
-
-    # Clean up temporary script
-    os.unlink(temp_script)
+    run_blender_script(blender_path, bpy_code)
 
     return screenshot_path
 
@@ -435,15 +437,7 @@ bpy.ops.render.render(animation=True)
     bpy_code = bpy_code.replace('{video_paths}', str(video_paths))
     bpy_code = bpy_code.replace('{output_path}', output_path)
 
-    # Save and run
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-        f.write(bpy_code)
-        temp_script = f.name
-
-    cmd = [blender_path, "--background", "--python", temp_script]
-    subprocess.run(cmd)
-
-    os.unlink(temp_script)
+    run_blender_script(blender_path, bpy_code)
     return output_path
 
 
@@ -4,16 +4,106 @@ Flexible scene configuration system for any type of scene
 Provides full control over scene properties, objects, lighting, and cameras
 """
 
-import json
 import os
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Union, get_args, get_origin, get_type_hints
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from functools import lru_cache
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _field_names(cls) -> tuple:
+    """
+    Public field names of a dataclass type, computed once per type.
+    Underscore fields are internal state and are skipped, matching orjson.
+    """
+    return tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+
+
+# Public slot names per exported dataclass type, filled on first export
+_EXPORT_SLOTS: Dict[type, tuple] = {}
+
+
+def _json_default(obj):
+    """json.dump hook: expose a slotted dataclass as a shallow dict of its public slots"""
+    cls = type(obj)
+    names = _EXPORT_SLOTS.get(cls)
+    if names is None:
+        if not is_dataclass(cls):
+            raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+        names = _EXPORT_SLOTS[cls] = tuple(n for n in cls.__slots__ if not n.startswith('_'))
+    return {name: getattr(obj, name) for name in names}
+
+
+EXPORT_BUFFER_SIZE = 1 << 20
+
+_DIVIDER = '=' * 60
+
+def _freeze_table(value):
+    """
+    Read-only, shared form of a preset table: dicts become MappingProxyType,
+    lists become tuples and strings are interned
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze_table(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_table(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# Per-dataclass dict -> instance builders, generated on first use
+_FROM_DICT_FUNCS: Dict[type, Callable] = {}
+
+
+def _field_converter(tp) -> Optional[Callable]:
+    """Converter for one annotated field type, or None when the value passes through"""
+    origin = get_origin(tp)
+    if origin is Union:
+        args = [a for a in get_args(tp) if a is not type(None)]
+        inner = _field_converter(args[0]) if len(args) == 1 else None
+        return (lambda v: None if v is None else inner(v)) if inner else None
+    if origin is list:
+        inner = _field_converter(get_args(tp)[0])
+        return (lambda v: None if v is None else [inner(x) for x in v]) if inner else None
+    if tp is tuple:
+        # JSON turns tuples into lists
+        return lambda v: tuple(v) if isinstance(v, list) else v
+    if is_dataclass(tp):
+        return lambda v: _from_dict(tp, v) if isinstance(v, dict) else v
+    return None
+
+
+def _from_dict(cls, data: Dict):
+    """Build a dataclass (and its nested dataclasses) from a plain dict"""
+    build = _FROM_DICT_FUNCS.get(cls)
+    if build is None:
+        hints = get_type_hints(cls)
+        converters = tuple((name, _field_converter(hints[name])) for name in _field_names(cls))
+
+        def build(d):
+            kwargs = {}
+            for name, convert in converters:
+                if name in d:
+                    kwargs[name] = convert(d[name]) if convert else d[name]
+            return cls(**kwargs)
+
+        _FROM_DICT_FUNCS[cls] = build
+    return build(data)
+
+
+@dataclass(slots=True)
 class SceneObject:
     """Represents an object in the scene"""
     name: str
@@ -27,7 +117,7 @@ class SceneObject:
     properties: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Camera:
     """Camera configuration"""
     name: str
@@ -38,7 +128,7 @@ class Camera:
     fov: float = 50.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LightSource:
     """Light configuration"""
     name: str
@@ -50,7 +140,19 @@ class LightSource:
     rotation: tuple = (0, 0, 0)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ColorGrading:
+    """Color grading preset (immutable, safe to share between scenes)"""
+    temp: float
+    saturation: float
+    contrast: float
+    
+    def as_dict(self) -> Dict:
+        """Plain dict form stored on SceneConfig.color_grading"""
+        return {'temp': self.temp, 'saturation': self.saturation, 'contrast': self.contrast}
+
+
+@dataclass(slots=True)
 class SceneConfig:
     """Complete scene configuration"""
     name: str
@@ -80,11 +182,167 @@ class SceneConfig:
     samples: int = 64
     use_gpu: bool = True
     
+    # Cached get_scene_info() summary, cleared whenever the scene is modified
+    _info: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.objects is None:
             self.objects = []
         if self.lights is None:
             self.lights = []
+    
+    def invalidate_info(self):
+        """Drop the cached summary after changing the scene"""
+        self._info = None
+
+
+def _clone_scene_config(source: SceneConfig, name: str) -> SceneConfig:
+    """
+    Structural copy of a scene: new object/light/camera instances and copies of
+    their dicts, while immutable tuples and primitives are shared
+    """
+    return replace(
+        source,
+        name=name,
+        objects=[
+            replace(o,
+                    animation=dict(o.animation) if o.animation else o.animation,
+                    properties=dict(o.properties) if o.properties else o.properties)
+            for o in source.objects
+        ],
+        lights=[replace(light) for light in source.lights],
+        camera=replace(source.camera) if source.camera else None,
+        color_grading=dict(source.color_grading) if source.color_grading else source.color_grading
+    )
+
+
+# Predefined scene templates
+_SCENE_TEMPLATES = _freeze_table({
+    'empty': {
+        'description': 'Empty scene with default lighting',
+        'objects': [],
+        'lights': [
+            {
+                'name': 'Key Light',
+                'type': 'SUN',
+                'position': (5, 5, 10),
+                'energy': 2.0,
+                'color': (1.0, 0.95, 0.8)
+            }
+        ]
+    },
+    'office': {
+        'description': 'Modern office environment',
+        'objects': [
+            {'name': 'Desk', 'type': 'prop', 'position': (0, 0, 0), 'color': '#8B4513'},
+            {'name': 'Chair', 'type': 'prop', 'position': (0, -1, 0), 'color': '#333333'},
+            {'name': 'Monitor', 'type': 'prop', 'position': (0.5, 0, 1), 'color': '#000000'},
+            {'name': 'Lamp', 'type': 'light', 'position': (0, 0, 2), 'color': '#FFFF99'}
+        ],
+        'lights': [
+            {'name': 'Ceiling', 'type': 'AREA', 'position': (0, 0, 4), 'energy': 1.5},
+            {'name': 'Window', 'type': 'SUN', 'position': (5, 5, 5), 'energy': 1.0}
+        ],
+        'background_color': (0.95, 0.95, 0.95)
+    },
+    'studio': {
+        'description': 'Professional studio setup',
+        'objects': [],
+        'lights': [
+            {'name': 'Key Light', 'type': 'AREA', 'position': (-3, -5, 4), 'energy': 2.0},
+            {'name': 'Fill Light', 'type': 'AREA', 'position': (3, -5, 3), 'energy': 1.0},
+            {'name': 'Back Light', 'type': 'POINT', 'position': (0, 5, 5), 'energy': 1.5}
+        ],
+        'background_color': (0.5, 0.5, 0.5),
+        'color_grading': {'temp': 'cool', 'saturation': 0.9}
+    },
+    'outdoor': {
+        'description': 'Outdoor natural environment',
+        'objects': [
+            {'name': 'Ground', 'type': 'environment', 'color': '#90EE90'},
+            {'name': 'Sky', 'type': 'environment', 'color': '#87CEEB'}
+        ],
+        'lights': [
+            {'name': 'Sun', 'type': 'SUN', 'position': (10, 10, 10), 'energy': 3.0, 'color': (1.0, 0.95, 0.8)},
+            {'name': 'Sky', 'type': 'SUN', 'position': (-5, -5, 3), 'energy': 0.5, 'color': (0.8, 0.9, 1.0)}
+        ],
+        'background_color': (0.7, 0.85, 1.0),
+        'ambient_light_strength': 0.7
+    },
+    'dark_dramatic': {
+        'description': 'Dark dramatic scene',
+        'objects': [],
+        'lights': [
+            {'name': 'Key Light', 'type': 'SPOT', 'position': (-5, -5, 5), 'energy': 2.5},
+            {'name': 'Fill Light', 'type': 'POINT', 'position': (5, 5, 2), 'energy': 0.3}
+        ],
+        'background_color': (0.05, 0.05, 0.05),
+        'color_grading': {'temp': 'warm', 'saturation': 0.7},
+        'bloom': True
+    }
+})
+
+# Lighting presets for different moods
+_LIGHTING_PRESETS = _freeze_table({
+    'soft': {
+        'ambient_strength': 0.7,
+        'lights': [
+            {'type': 'AREA', 'position': (-3, -3, 5), 'energy': 1.5},
+            {'type': 'AREA', 'position': (3, -3, 4), 'energy': 1.0}
+        ]
+    },
+    'dramatic': {
+        'ambient_strength': 0.3,
+        'lights': [
+            {'type': 'SPOT', 'position': (-5, -5, 6), 'energy': 2.5},
+            {'type': 'POINT', 'position': (3, 3, 2), 'energy': 0.4}
+        ]
+    },
+    'natural': {
+        'ambient_strength': 0.6,
+        'lights': [
+            {'type': 'SUN', 'position': (5, 5, 8), 'energy': 2.0, 'color': (1.0, 0.95, 0.8)},
+            {'type': 'SUN', 'position': (-5, -5, 3), 'energy': 0.5, 'color': (0.8, 0.9, 1.0)}
+        ]
+    },
+    'cinematic': {
+        'ambient_strength': 0.4,
+        'lights': [
+            {'type': 'AREA', 'position': (-4, -4, 6), 'energy': 2.0, 'color': (1.0, 0.95, 0.7)},
+            {'type': 'AREA', 'position': (4, -4, 3), 'energy': 0.8, 'color': (0.7, 0.9, 1.0)},
+            {'type': 'POINT', 'position': (0, 5, 3), 'energy': 0.5}
+        ]
+    }
+})
+
+# Color grading presets
+_COLOR_GRADING_PRESETS = MappingProxyType({
+    'neutral': ColorGrading(temp=0, saturation=1.0, contrast=1.0),
+    'warm': ColorGrading(temp=0.3, saturation=1.1, contrast=1.0),
+    'cool': ColorGrading(temp=-0.3, saturation=1.0, contrast=1.0),
+    'cinematic': ColorGrading(temp=0.1, saturation=0.9, contrast=1.1),
+    'vintage': ColorGrading(temp=0.2, saturation=0.7, contrast=0.9),
+    'noir': ColorGrading(temp=-0.1, saturation=0.5, contrast=1.3)
+})
+
+# Scalar SceneConfig fields a template may override
+_TEMPLATE_SCENE_SETTINGS = ('background_color', 'ambient_light_strength', 'bloom')
+
+def _as_record(obj) -> tuple:
+    """Field values of a dataclass as a plain tuple, in constructor order"""
+    return tuple(getattr(obj, name) for name in _field_names(type(obj)))
+
+
+# Template objects/lights resolved once into positional records;
+# create_custom_scene builds instances with SceneObject(*record) instead of
+# re-unpacking the template dicts on every call
+_COMPILED_TEMPLATES = {
+    name: {
+        'objects': tuple(_as_record(SceneObject(**obj_data)) for obj_data in template.get('objects', [])),
+        'lights': tuple(_as_record(LightSource(**light_data)) for light_data in template.get('lights', [])),
+    }
+    for name, template in _SCENE_TEMPLATES.items()
+}
 
 
 class SceneSetupManager:
@@ -93,117 +351,15 @@ class SceneSetupManager:
     Allows creation of custom scenes without hardcoded warehouse setup
     """
     
-    # Predefined scene templates
-    SCENE_TEMPLATES = {
-        'empty': {
-            'description': 'Empty scene with default lighting',
-            'objects': [],
-            'lights': [
-                {
-                    'name': 'Key Light',
-                    'type': 'SUN',
-                    'position': (5, 5, 10),
-                    'energy': 2.0,
-                    'color': (1.0, 0.95, 0.8)
-                }
-            ]
-        },
-        'office': {
-            'description': 'Modern office environment',
-            'objects': [
-                {'name': 'Desk', 'type': 'prop', 'position': (0, 0, 0), 'color': '#8B4513'},
-                {'name': 'Chair', 'type': 'prop', 'position': (0, -1, 0), 'color': '#333333'},
-                {'name': 'Monitor', 'type': 'prop', 'position': (0.5, 0, 1), 'color': '#000000'},
-                {'name': 'Lamp', 'type': 'light', 'position': (0, 0, 2), 'color': '#FFFF99'}
-            ],
-            'lights': [
-                {'name': 'Ceiling', 'type': 'AREA', 'position': (0, 0, 4), 'energy': 1.5},
-                {'name': 'Window', 'type': 'SUN', 'position': (5, 5, 5), 'energy': 1.0}
-            ],
-            'background_color': (0.95, 0.95, 0.95)
-        },
-        'studio': {
-            'description': 'Professional studio setup',
-            'objects': [],
-            'lights': [
-                {'name': 'Key Light', 'type': 'AREA', 'position': (-3, -5, 4), 'energy': 2.0},
-                {'name': 'Fill Light', 'type': 'AREA', 'position': (3, -5, 3), 'energy': 1.0},
-                {'name': 'Back Light', 'type': 'POINT', 'position': (0, 5, 5), 'energy': 1.5}
-            ],
-            'background_color': (0.5, 0.5, 0.5),
-            'color_grading': {'temp': 'cool', 'saturation': 0.9}
-        },
-        'outdoor': {
-            'description': 'Outdoor natural environment',
-            'objects': [
-                {'name': 'Ground', 'type': 'environment', 'color': '#90EE90'},
-                {'name': 'Sky', 'type': 'environment', 'color': '#87CEEB'}
-            ],
-            'lights': [
-                {'name': 'Sun', 'type': 'SUN', 'position': (10, 10, 10), 'energy': 3.0, 'color': (1.0, 0.95, 0.8)},
-                {'name': 'Sky', 'type': 'SUN', 'position': (-5, -5, 3), 'energy': 0.5, 'color': (0.8, 0.9, 1.0)}
-            ],
-            'background_color': (0.7, 0.85, 1.0),
-            'ambient_light_strength': 0.7
-        },
-        'dark_dramatic': {
-            'description': 'Dark dramatic scene',
-            'objects': [],
-            'lights': [
-                {'name': 'Key Light', 'type': 'SPOT', 'position': (-5, -5, 5), 'energy': 2.5},
-                {'name': 'Fill Light', 'type': 'POINT', 'position': (5, 5, 2), 'energy': 0.3}
-            ],
-            'background_color': (0.05, 0.05, 0.05),
-            'color_grading': {'temp': 'warm', 'saturation': 0.7},
-            'bloom': True
-        }
-    }
-    
-    # Lighting presets for different moods
-    LIGHTING_PRESETS = {
-        'soft': {
-            'ambient_strength': 0.7,
-            'lights': [
-                {'type': 'AREA', 'position': (-3, -3, 5), 'energy': 1.5},
-                {'type': 'AREA', 'position': (3, -3, 4), 'energy': 1.0}
-            ]
-        },
-        'dramatic': {
-            'ambient_strength': 0.3,
-            'lights': [
-                {'type': 'SPOT', 'position': (-5, -5, 6), 'energy': 2.5},
-                {'type': 'POINT', 'position': (3, 3, 2), 'energy': 0.4}
-            ]
-        },
-        'natural': {
-            'ambient_strength': 0.6,
-            'lights': [
-                {'type': 'SUN', 'position': (5, 5, 8), 'energy': 2.0, 'color': (1.0, 0.95, 0.8)},
-                {'type': 'SUN', 'position': (-5, -5, 3), 'energy': 0.5, 'color': (0.8, 0.9, 1.0)}
-            ]
-        },
-        'cinematic': {
-            'ambient_strength': 0.4,
-            'lights': [
-                {'type': 'AREA', 'position': (-4, -4, 6), 'energy': 2.0, 'color': (1.0, 0.95, 0.7)},
-                {'type': 'AREA', 'position': (4, -4, 3), 'energy': 0.8, 'color': (0.7, 0.9, 1.0)},
-                {'type': 'POINT', 'position': (0, 5, 3), 'energy': 0.5}
-            ]
-        }
-    }
-    
-    # Color grading presets
-    COLOR_GRADING_PRESETS = {
-        'neutral': {'temp': 0, 'saturation': 1.0, 'contrast': 1.0},
-        'warm': {'temp': 0.3, 'saturation': 1.1, 'contrast': 1.0},
-        'cool': {'temp': -0.3, 'saturation': 1.0, 'contrast': 1.0},
-        'cinematic': {'temp': 0.1, 'saturation': 0.9, 'contrast': 1.1},
-        'vintage': {'temp': 0.2, 'saturation': 0.7, 'contrast': 0.9},
-        'noir': {'temp': -0.1, 'saturation': 0.5, 'contrast': 1.3}
-    }
+    # Preset tables live at module level (read-only); aliased here for callers
+    SCENE_TEMPLATES = _SCENE_TEMPLATES
+    LIGHTING_PRESETS = _LIGHTING_PRESETS
+    COLOR_GRADING_PRESETS = _COLOR_GRADING_PRESETS
     
     def __init__(self):
         """Initialize scene setup manager"""
+        # Keys are interned on insertion so repeated lookups with the same
+        # name objects hit the identity fast path in dict lookups
         self.scenes: Dict[str, SceneConfig] = {}
         self.current_scene: Optional[SceneConfig] = None
         logger.info("SceneSetupManager initialized")
@@ -228,11 +384,7 @@ class SceneSetupManager:
             SceneConfig object
         """
         
-        # Start with template if provided
-        config_dict = {}
-        if template and template in self.SCENE_TEMPLATES:
-            template_data = self.SCENE_TEMPLATES[template]
-            config_dict.update(template_data)
+        template_data = _SCENE_TEMPLATES.get(template) if template else None
         
         # Create base config
         config = SceneConfig(
@@ -243,26 +395,24 @@ class SceneSetupManager:
         )
         
         # Apply template settings
-        if template and template in self.SCENE_TEMPLATES:
-            template_data = self.SCENE_TEMPLATES[template]
-            
-            # Add objects from template
-            for obj_data in template_data.get('objects', []):
-                config.objects.append(SceneObject(**obj_data))
+        if template_data is not None:
+            compiled = _COMPILED_TEMPLATES[template]
             
-            # Add lights from template
-            for light_data in template_data.get('lights', []):
-                config.lights.append(LightSource(**light_data))
+            # Add objects/lights from template; extending with a ready list
+            # resizes once instead of growing per generated item
+            config.objects.extend([SceneObject(*record) for record in compiled['objects']])
+            config.lights.extend([LightSource(*record) for record in compiled['lights']])
             
             # Apply template settings
-            if 'background_color' in template_data:
-                config.background_color = template_data['background_color']
+            for key in _TEMPLATE_SCENE_SETTINGS:
+                if key in template_data:
+                    setattr(config, key, template_data[key])
             if 'color_grading' in template_data:
-                config.color_grading = template_data['color_grading']
+                config.color_grading = dict(template_data['color_grading'])
         
-        self.scenes[name] = config
+        self.scenes[sys.intern(name)] = config
         self.current_scene = config
-        logger.info(f"Created scene: {name}")
+        logger.info("Created scene: %s", name)
         
         return config
     
@@ -277,29 +427,25 @@ class SceneSetupManager:
         Returns:
             Success status
         """
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            logger.error("Scene not found: %s", scene_name)
             return False
         
-        if preset not in self.LIGHTING_PRESETS:
-            logger.error(f"Lighting preset not found: {preset}")
+        preset_data = _LIGHTING_PRESETS.get(preset)
+        if preset_data is None:
+            logger.error("Lighting preset not found: %s", preset)
             return False
         
-        scene = self.scenes[scene_name]
-        preset_data = self.LIGHTING_PRESETS[preset]
-        
         # Update ambient light
         scene.ambient_light_strength = preset_data['ambient_strength']
         
         # Replace lights
-        scene.lights = []
-        for light_data in preset_data['lights']:
-            scene.lights.append(LightSource(
-                name=f"{preset.capitalize()} Light",
-                **light_data
-            ))
+        light_name = preset.capitalize() + " Light"
+        scene.lights = [LightSource(name=light_name, **light_data) for light_data in preset_data['lights']]
+        scene.invalidate_info()
         
-        logger.info(f"Applied lighting preset '{preset}' to scene '{scene_name}'")
+        logger.info("Applied lighting preset '%s' to scene '%s'", preset, scene_name)
         return True
     
     def apply_color_grading_preset(self, scene_name: str, preset: str) -> bool:
@@ -313,67 +459,75 @@ class SceneSetupManager:
         Returns:
             Success status
         """
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            logger.error("Scene not found: %s", scene_name)
             return False
         
-        if preset not in self.COLOR_GRADING_PRESETS:
-            logger.error(f"Color grading preset not found: {preset}")
+        preset_data = _COLOR_GRADING_PRESETS.get(preset)
+        if preset_data is None:
+            logger.error("Color grading preset not found: %s", preset)
             return False
         
-        scene = self.scenes[scene_name]
-        scene.color_grading = self.COLOR_GRADING_PRESETS[preset]
+        scene.color_grading = preset_data.as_dict()
+        scene.invalidate_info()
         
-        logger.info(f"Applied color grading preset '{preset}' to scene '{scene_name}'")
+        logger.info("Applied color grading preset '%s' to scene '%s'", preset, scene_name)
         return True
     
     def add_object_to_scene(self, 
                            scene_name: str,
                            obj: SceneObject) -> bool:
         """Add an object to a scene"""
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            logger.error("Scene not found: %s", scene_name)
             return False
         
-        self.scenes[scene_name].objects.append(obj)
-        logger.info(f"Added object '{obj.name}' to scene '{scene_name}'")
+        scene.objects.append(obj)
+        scene.invalidate_info()
+        logger.info("Added object '%s' to scene '%s'", obj.name, scene_name)
         return True
     
     def add_light_to_scene(self,
                           scene_name: str,
                           light: LightSource) -> bool:
         """Add a light to a scene"""
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            logger.error("Scene not found: %s", scene_name)
             return False
         
-        self.scenes[scene_name].lights.append(light)
-        logger.info(f"Added light '{light.name}' to scene '{scene_name}'")
+        scene.lights.append(light)
+        scene.invalidate_info()
+        logger.info("Added light '%s' to scene '%s'", light.name, scene_name)
         return True
     
     def configure_camera(self,
                         scene_name: str,
                         camera: Camera) -> bool:
         """Configure scene camera"""
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            logger.error("Scene not found: %s", scene_name)
             return False
         
-        self.scenes[scene_name].camera = camera
-        logger.info(f"Configured camera for scene '{scene_name}'")
+        scene.camera = camera
+        scene.invalidate_info()
+        logger.info("Configured camera for scene '%s'", scene_name)
         return True
     
     def list_templates(self) -> List[str]:
         """List available templates"""
-        return list(self.SCENE_TEMPLATES.keys())
+        return list(_SCENE_TEMPLATES.keys())
     
     def list_lighting_presets(self) -> List[str]:
         """List available lighting presets"""
-        return list(self.LIGHTING_PRESETS.keys())
+        return list(_LIGHTING_PRESETS.keys())
     
     def list_color_grading_presets(self) -> List[str]:
         """List available color grading presets"""
-        return list(self.COLOR_GRADING_PRESETS.keys())
+        return list(_COLOR_GRADING_PRESETS.keys())
     
     def get_scene(self, scene_name: str) -> Optional[SceneConfig]:
         """Get a scene configuration"""
@@ -385,73 +539,89 @@ class SceneSetupManager:
     
     def export_scene(self, scene_name: str, output_path: str) -> bool:
         """Export scene configuration to JSON"""
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
-            return False
+        import json
         
-        scene = self.scenes[scene_name]
-        scene_dict = asdict(scene)
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            logger.error("Scene not found: %s", scene_name)
+            return False
         
         try:
-            with open(output_path, 'w') as f:
-                json.dump(scene_dict, f, indent=2)
-            logger.info(f"Exported scene '{scene_name}' to {output_path}")
+            if ORJSON_AVAILABLE:
+                # orjson serializes dataclasses natively in C
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(scene, option=orjson.OPT_INDENT_2))
+            else:
+                # json walks the dataclasses lazily through _json_default; the 1 MB
+                # buffer coalesces its many small chunk writes
+                with open(output_path, 'w', buffering=EXPORT_BUFFER_SIZE) as f:
+                    json.dump(scene, f, indent=2, default=_json_default)
+            logger.info("Exported scene '%s' to %s", scene_name, output_path)
             return True
         except Exception as e:
-            logger.error(f"Error exporting scene: {e}")
+            logger.error("Error exporting scene: %s", e)
             return False
     
     def import_scene(self, json_path: str, scene_name: Optional[str] = None) -> bool:
         """Import scene configuration from JSON"""
+        import json
+        import mmap
+        
         try:
-            with open(json_path, 'r') as f:
-                scene_dict = json.load(f)
+            with open(json_path, 'rb') as f:
+                if ORJSON_AVAILABLE:
+                    # Parse straight from the mapped pages, no intermediate bytes copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        scene_dict = orjson.loads(view)
+                else:
+                    scene_dict = json.loads(f.read())
             
             name = scene_name or scene_dict.get('name', 'imported_scene')
-            config = SceneConfig(**scene_dict)
-            self.scenes[name] = config
+            config = _from_dict(SceneConfig, scene_dict)
+            self.scenes[sys.intern(name)] = config
             
-            logger.info(f"Imported scene from {json_path}")
+            logger.info("Imported scene from %s", json_path)
             return True
         except Exception as e:
-            logger.error(f"Error importing scene: {e}")
+            logger.error("Error importing scene: %s", e)
             return False
     
     def delete_scene(self, scene_name: str) -> bool:
         """Delete a scene"""
-        if scene_name not in self.scenes:
-            logger.error(f"Scene not found: {scene_name}")
+        if self.scenes.pop(scene_name, None) is None:
+            logger.error("Scene not found: %s", scene_name)
             return False
         
-        del self.scenes[scene_name]
         if self.current_scene and self.current_scene.name == scene_name:
             self.current_scene = None
         
-        logger.info(f"Deleted scene '{scene_name}'")
+        logger.info("Deleted scene '%s'", scene_name)
         return True
     
     def clone_scene(self, source_name: str, target_name: str) -> bool:
         """Clone an existing scene"""
-        if source_name not in self.scenes:
-            logger.error(f"Source scene not found: {source_name}")
+        source = self.scenes.get(source_name)
+        if source is None:
+            logger.error("Source scene not found: %s", source_name)
             return False
         
-        import copy
-        source = self.scenes[source_name]
-        cloned = copy.deepcopy(source)
-        cloned.name = target_name
+        cloned = _clone_scene_config(source, target_name)
         
-        self.scenes[target_name] = cloned
-        logger.info(f"Cloned scene '{source_name}' to '{target_name}'")
+        self.scenes[sys.intern(target_name)] = cloned
+        logger.info("Cloned scene '%s' to '%s'", source_name, target_name)
         return True
     
     def get_scene_info(self, scene_name: str) -> Optional[Dict]:
         """Get detailed scene information"""
-        if scene_name not in self.scenes:
+        scene = self.scenes.get(scene_name)
+        if scene is None:
             return None
         
-        scene = self.scenes[scene_name]
-        return {
+        # Callers get their own copy so enriching the result can't alter the cache
+        if scene._info is not None:
+            return dict(scene._info)
+        
+        scene._info = {
             'name': scene.name,
             'description': scene.description,
             'duration': scene.duration,
@@ -463,6 +633,7 @@ class SceneSetupManager:
             'background_color': scene.background_color,
             'color_grading': scene.color_grading
         }
+        return dict(scene._info)
     
     def print_scene_summary(self, scene_name: str):
         """Print a formatted summary of a scene"""
@@ -471,19 +642,24 @@ class SceneSetupManager:
             print(f"Scene '{scene_name}' not found")
             return
         
-        print(f"\n{'='*60}")
-        print(f"SCENE: {info['name']}")
-        print(f"{'='*60}")
-        print(f"Description: {info['description']}")
-        print(f"Duration: {info['duration']:.1f} seconds")
-        print(f"Resolution: {info['resolution'][0]}x{info['resolution'][1]}")
-        print(f"Objects: {info['objects_count']}")
-        print(f"Lights: {info['lights_count']}")
-        print(f"Render Engine: {info['render_engine']}")
-        print(f"Camera: {'Yes' if info['has_camera'] else 'No'}")
-        print(f"Background Color: {info['background_color']}")
-        print(f"Color Grading: {info['color_grading']}")
-        print(f"{'='*60}\n")
+        lines = [
+            "",
+            _DIVIDER,
+            "SCENE: " + str(info['name']),
+            _DIVIDER,
+            "Description: " + str(info['description']),
+            "Duration: %.1f seconds" % info['duration'],
+            "Resolution: %sx%s" % (info['resolution'][0], info['resolution'][1]),
+            "Objects: " + str(info['objects_count']),
+            "Lights: " + str(info['lights_count']),
+            "Render Engine: " + str(info['render_engine']),
+            "Camera: " + ('Yes' if info['has_camera'] else 'No'),
+            "Background Color: " + str(info['background_color']),
+            "Color Grading: " + str(info['color_grading']),
+            _DIVIDER,
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Example usage
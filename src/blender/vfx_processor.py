@@ -4,14 +4,208 @@ Handles visual filters, post-processing, and Blender particle effects.
 """
 
 import os
+import queue
+import string
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 import cv2
 import numpy as np
-from typing import Optional, Dict, Tuple, List
+from typing import Any, Iterator, Optional, Dict, Tuple, List
 import logging
 from pathlib import Path
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# BT.601 luma weights for a BGR pixel
+_LUMA_WEIGHTS = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+
+# Per-style grade parameters: (shadow blue boost, green scale, green highlight boost,
+# red scale, red highlight boost)
+_GRADE_PARAMS: Dict[str, Tuple[float, float, float, float, float]] = {
+    'teal_orange': (0.2, 1.0, 0.1, 1.0, 0.15),
+    'blue_yellow': (0.15, 1.0, 0.2, 1.0, 0.2),
+    'warm': (0.0, 1.05, 0.0, 1.1, 0.0),
+}
+
+
+def _grade_matrix(shadow_b: float, scale_g: float, high_g: float,
+                  scale_r: float, high_r: float) -> np.ndarray:
+    """
+    Fold a shadow/highlight grade into a 3x4 affine matrix for cv2.transform.
+    
+    With luma L in 0-255, the highlight mask is L/255 and the shadow mask
+    1 - 0.3*L/255, so every boost is linear in (b, g, r):
+        b' = b + 255*shadow_b - 0.3*shadow_b*L
+        g' = scale_g*g + high_g*L
+        r' = scale_r*r + high_r*L
+    """
+    matrix = np.zeros((3, 4), dtype=np.float32)
+    matrix[0, :3] = -0.3 * shadow_b * _LUMA_WEIGHTS
+    matrix[0, 0] += 1.0
+    matrix[0, 3] = 255.0 * shadow_b
+    matrix[1, :3] = high_g * _LUMA_WEIGHTS
+    matrix[1, 1] += scale_g
+    matrix[2, :3] = high_r * _LUMA_WEIGHTS
+    matrix[2, 2] += scale_r
+    return matrix
+
+
+_GRADE_MATRICES: Dict[str, np.ndarray] = {
+    style: _grade_matrix(*params) for style, params in _GRADE_PARAMS.items()
+}
+
+# Frames grouped into one stacked image for the batched filters in process_video_with_vfx
+VFX_BATCH_SIZE = 8
+
+# Decoded batches buffered ahead of the filter workers
+VFX_QUEUE_SIZE = 8
+
+
+# Separable form of the 3x3 Gaussian used to smooth film grain
+_GRAIN_KERNEL = np.array([0.25, 0.5, 0.25], dtype=np.float32)
+
+
+@lru_cache(maxsize=16)
+def _gaussian_kernel(radius: int) -> np.ndarray:
+    """1D float32 Gaussian for a (2r+1)-tap separable blur, sigma derived from size as GaussianBlur does."""
+    kernel = cv2.getGaussianKernel(radius * 2 + 1, 0, cv2.CV_32F)
+    kernel.flags.writeable = False
+    return kernel
+
+
+@dataclass(frozen=True)
+class _VFXSettings:
+    """process_video_with_vfx options, parsed from the config dict once per video."""
+    color_grade: Optional[str] = None
+    grain: Optional[float] = None
+    sharpness: Optional[float] = None
+    distortion: Optional[float] = None
+    chromatic: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, vfx_config: Dict) -> '_VFXSettings':
+        return cls(**{key: vfx_config.get(key) for key in cls.__dataclass_fields__})
+
+
+
+def cache_cube_lut(cube_path: str) -> str:
+    """
+    Convert an Adobe/Resolve .cube LUT into a float32 .npy next to it, in the
+    layout apply_lut_color_grade expects: 3D LUTs as (M, M, M, 3) indexed
+    [b, g, r] with BGR values, 1D LUTs as (N, 3) BGR columns.
+    The .npy is rebuilt only when the .cube is newer.
+    
+    Args:
+        cube_path: Path to .cube file
+        
+    Returns:
+        Path to the cached .npy
+    """
+    npy_path = cube_path + '.npy'
+    if (os.path.exists(npy_path)
+            and os.path.getmtime(npy_path) >= os.path.getmtime(cube_path)):
+        return npy_path
+    
+    size_3d = size_1d = None
+    rows = []
+    with open(cube_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('LUT_3D_SIZE'):
+                size_3d = int(line.split()[1])
+            elif line.startswith('LUT_1D_SIZE'):
+                size_1d = int(line.split()[1])
+            elif line[0].isdigit() or line[0] in '-.':
+                rows.append(line)
+    
+    data = np.loadtxt(rows, dtype=np.float32, ndmin=2)[:, ::-1]  # RGB -> BGR
+    if size_3d is not None:
+        # .cube lists red fastest, then green, then blue
+        lut = data.reshape(size_3d, size_3d, size_3d, 3)
+    elif size_1d is not None:
+        lut = data.reshape(size_1d, 3)
+    else:
+        raise ValueError(f"No LUT size declared in {cube_path}")
+    
+    np.save(npy_path, np.ascontiguousarray(lut))
+    return npy_path
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _lut3d_kernel(frame, lut, m, tetrahedral, out):
+        """
+        Sample a flattened (M*M*M, 3) cube LUT, indexed [b, g, r], at every
+        pixel with trilinear (8 corner) or tetrahedral (4 corner) interpolation.
+        """
+        h, w = frame.shape[0], frame.shape[1]
+        scale = np.float32((m - 1) / 255.0)
+        sb, sg, sr = m * m, m, 1
+        for y in prange(h):
+            for x in range(w):
+                fb = np.float32(frame[y, x, 0]) * scale
+                fg = np.float32(frame[y, x, 1]) * scale
+                fr = np.float32(frame[y, x, 2]) * scale
+                ib = min(np.int32(fb), m - 2)
+                ig = min(np.int32(fg), m - 2)
+                ir = min(np.int32(fr), m - 2)
+                db, dg, dr = fb - ib, fg - ig, fr - ir
+                base = ib * sb + ig * sg + ir
+
+                if tetrahedral:
+                    # Walk c000 -> c111 along the axes in order of decreasing fraction
+                    if db >= dg:
+                        if dg >= dr:
+                            s1, s2, f1, f2, f3 = sb, sb + sg, db, dg, dr
+                        elif db >= dr:
+                            s1, s2, f1, f2, f3 = sb, sb + sr, db, dr, dg
+                        else:
+                            s1, s2, f1, f2, f3 = sr, sr + sb, dr, db, dg
+                    else:
+                        if db >= dr:
+                            s1, s2, f1, f2, f3 = sg, sg + sb, dg, db, dr
+                        elif dg >= dr:
+                            s1, s2, f1, f2, f3 = sg, sg + sr, dg, dr, db
+                        else:
+                            s1, s2, f1, f2, f3 = sr, sr + sg, dr, dg, db
+                    for c in range(3):
+                        v = ((1 - f1) * lut[base, c] + (f1 - f2) * lut[base + s1, c]
+                             + (f2 - f3) * lut[base + s2, c] + f3 * lut[base + sb + sg + sr, c])
+                        out[y, x, c] = np.uint8(min(max(v, 0.0), 1.0) * 255.0)
+                else:
+                    for c in range(3):
+                        c00 = lut[base, c] + (lut[base + sr, c] - lut[base, c]) * dr
+                        c01 = lut[base + sg, c] + (lut[base + sg + sr, c] - lut[base + sg, c]) * dr
+                        c10 = lut[base + sb, c] + (lut[base + sb + sr, c] - lut[base + sb, c]) * dr
+                        c11 = (lut[base + sb + sg, c]
+                               + (lut[base + sb + sg + sr, c] - lut[base + sb + sg, c]) * dr)
+                        c0 = c00 + (c01 - c00) * dg
+                        c1 = c10 + (c11 - c10) * dg
+                        v = c0 + (c1 - c0) * db
+                        out[y, x, c] = np.uint8(min(max(v, 0.0), 1.0) * 255.0)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _unsharp_threshold_kernel(frame, blurred, amount, threshold, out):
+        """Thresholded unsharp mask over flattened uint8 frame/blur buffers."""
+        for i in prange(frame.size):
+            f = np.float32(frame[i])
+            d = f - np.float32(blurred[i])
+            if abs(d) >= threshold:
+                out[i] = np.uint8(min(max(f + amount * d, 0.0), 255.0))
+            else:
+                out[i] = frame[i]
+
 
 class VFXProcessor:
     """
@@ -20,17 +214,108 @@ class VFXProcessor:
 
     def __init__(self):
         """Initialize VFX processor."""
+        self._lut_cache: Dict[str, Tuple[float, np.ndarray]] = {}
+        self._distort_cache: Dict[Tuple[int, int, float], Tuple[np.ndarray, np.ndarray]] = {}
+        self._map_buffers: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._map_lock = threading.Lock()
+        # Per-thread grain buffer and CUDA upload/filter state, so video workers can
+        # run frames concurrently (GpuMats and cv2.cuda filters are not thread-safe)
+        self._local = threading.local()
+        
+        # GPU path for the sharpen/distort stages, used when OpenCV has CUDA devices
+        try:
+            self._use_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            self._use_cuda = False
+        self._gpu_distort_maps: Dict[Tuple[int, int, float], Tuple[object, object]] = {}
         logger.info("VFXProcessor initialized")
 
     # ==================== Color Grading ====================
 
-    def apply_lut_color_grade(self, frame: np.ndarray, lut_path: str) -> np.ndarray:
+    def _load_lut(self, lut_path: str) -> Optional[np.ndarray]:
+        """
+        Load a LUT and prepare it for per-frame application.
+
+        1D LUTs (N,) or (N, 3) are resampled into a (256, 1, 3) uint8 table for
+        cv2.LUT; 3D cube LUTs (M, M, M, 3), indexed [b, g, r], are kept as a
+        flattened float32 (M*M*M, 3) array. Results are cached by path and mtime.
+
+        Args:
+            lut_path: Path to LUT file (.npy, or .cube converted via cache_cube_lut)
+
+        Returns:
+            Prepared LUT, or None if the file is not a supported LUT
+        """
+        mtime = os.stat(lut_path).st_mtime
+        cached = self._lut_cache.get(lut_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        if lut_path.endswith('.cube'):
+            npy_path = cache_cube_lut(lut_path)
+        elif lut_path.endswith('.npy'):
+            npy_path = lut_path
+        else:
+            return None
+        
+        # Memory-mapped: the LUT stays in the page cache, shared between processes
+        lut = np.load(npy_path, mmap_mode='r')
+
+        if lut.ndim == 4 and lut.shape[0] == lut.shape[1] == lut.shape[2] >= 2 and lut.shape[3] == 3:
+            prepared = np.ascontiguousarray(lut.reshape(-1, 3), dtype=np.float32)
+        elif lut.ndim == 1 or (lut.ndim == 2 and lut.shape[1] == 3):
+            # Same index mapping as sampling the LUT per pixel, done once for all 256 levels
+            levels = np.arange(256, dtype=np.float32) / 255.0 * (len(lut) - 1)
+            idx = np.clip(levels.astype(np.int32), 0, len(lut) - 1)
+            table = (lut[idx] * 255).astype(np.uint8)
+            if table.ndim == 1:
+                table = np.repeat(table[:, np.newaxis], 3, axis=1)
+            prepared = np.ascontiguousarray(table.reshape(256, 1, 3))
+        else:
+            raise ValueError(f"Unsupported LUT shape: {lut.shape}")
+
+        self._lut_cache[lut_path] = (mtime, prepared)
+        return prepared
+
+    @staticmethod
+    def _apply_3d_lut(frame: np.ndarray, lut_flat: np.ndarray) -> np.ndarray:
+        """Trilinearly interpolate a flattened 3D LUT at every pixel of a BGR frame."""
+        m = round(len(lut_flat) ** (1 / 3))
+        scaled = frame.astype(np.float32) * ((m - 1) / 255.0)
+        i0 = np.minimum(scaled.astype(np.int32), m - 2)
+        d = scaled - i0
+        db, dg, dr = d[..., 0:1], d[..., 1:2], d[..., 2:3]
+        base = i0[..., 0] * (m * m) + i0[..., 1] * m + i0[..., 2]
+
+        c000 = lut_flat[base]
+        c001 = lut_flat[base + 1]
+        c010 = lut_flat[base + m]
+        c011 = lut_flat[base + m + 1]
+        c100 = lut_flat[base + m * m]
+        c101 = lut_flat[base + m * m + 1]
+        c110 = lut_flat[base + m * m + m]
+        c111 = lut_flat[base + m * m + m + 1]
+
+        c00 = c000 + (c001 - c000) * dr
+        c01 = c010 + (c011 - c010) * dr
+        c10 = c100 + (c101 - c100) * dr
+        c11 = c110 + (c111 - c110) * dr
+        c0 = c00 + (c01 - c00) * dg
+        c1 = c10 + (c11 - c10) * dg
+        graded = c0 + (c1 - c0) * db
+
+        return np.clip(graded * 255, 0, 255).astype(np.uint8)
+
+    def apply_lut_color_grade(self, frame: np.ndarray, lut_path: str,
+                              interpolation: str = 'trilinear') -> np.ndarray:
         """
         Apply color lookup table (LUT) for professional color grading.
         
         Args:
             frame: Input frame (BGR)
-            lut_path: Path to LUT file (cube format)
+            lut_path: Path to LUT file (1D curve or 3D cube, .npy or .cube)
+            interpolation: 'trilinear' or 'tetrahedral' sampling for 3D LUTs
+                           (tetrahedral needs numba, otherwise trilinear is used)
             
         Returns:
             Color-graded frame
@@ -40,21 +325,22 @@ class VFXProcessor:
                 logger.warning(f"LUT file not found: {lut_path}")
                 return frame
             
-            # Load LUT (simplified - real LUT processing would be more complex)
-            lut = np.load(lut_path) if lut_path.endswith('.npy') else None
+            lut = self._load_lut(lut_path)
             
-            if lut is not None:
-                # Apply LUT mapping (3D interpolation)
-                frame_normalized = (frame.astype(np.float32) / 255.0 * (len(lut) - 1)).astype(np.int32)
-                frame_normalized = np.clip(frame_normalized, 0, len(lut) - 1)
-                
-                graded = np.zeros_like(frame, dtype=np.uint8)
-                for i in range(3):
-                    graded[:, :, i] = (lut[frame_normalized[:, :, i]] * 255).astype(np.uint8)
-                
-                return graded
+            if lut is None:
+                return frame
             
-            return frame
+            if lut.dtype == np.uint8:
+                return cv2.LUT(frame, lut)
+            
+            if NUMBA_AVAILABLE and frame.ndim == 3:
+                out = np.empty_like(frame, dtype=np.uint8)
+                m = round(len(lut) ** (1 / 3))
+                _lut3d_kernel(np.ascontiguousarray(frame), lut, m,
+                              interpolation == 'tetrahedral', out)
+                return out
+            
+            return self._apply_3d_lut(frame, lut)
             
         except Exception as e:
             logger.warning(f"Error applying LUT: {e}")
@@ -71,41 +357,17 @@ class VFXProcessor:
         Returns:
             Color-graded frame
         """
-        frame_float = frame.astype(np.float32) / 255.0
-        
-        if style == 'teal_orange':
-            # Teal shadows, orange highlights (popular cinematic look)
-            # Shadows: boost blue
-            shadow_mask = 1 - cv2.cvtColor((frame * 0.3).astype(np.uint8), cv2.COLOR_BGR2GRAY).astype(np.float32) / 255
-            frame_float[:, :, 0] = np.clip(frame_float[:, :, 0] + shadow_mask * 0.2, 0, 1)  # Blue
-            
-            # Highlights: boost red/yellow
-            highlight_mask = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY).astype(np.float32) / 255
-            frame_float[:, :, 2] = np.clip(frame_float[:, :, 2] + highlight_mask * 0.15, 0, 1)  # Red
-            frame_float[:, :, 1] = np.clip(frame_float[:, :, 1] + highlight_mask * 0.1, 0, 1)   # Green
-        
-        elif style == 'blue_yellow':
-            # Blue shadows, yellow highlights
-            shadow_mask = 1 - cv2.cvtColor((frame * 0.3).astype(np.uint8), cv2.COLOR_BGR2GRAY).astype(np.float32) / 255
-            frame_float[:, :, 0] = np.clip(frame_float[:, :, 0] + shadow_mask * 0.15, 0, 1)
-            
-            highlight_mask = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY).astype(np.float32) / 255
-            frame_float[:, :, 1] = np.clip(frame_float[:, :, 1] + highlight_mask * 0.2, 0, 1)
-            frame_float[:, :, 2] = np.clip(frame_float[:, :, 2] + highlight_mask * 0.2, 0, 1)
-        
-        elif style == 'desaturated':
-            # Reduce saturation for dramatic look
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV).astype(np.float32)
-            hsv[:, :, 1] *= 0.6  # Reduce saturation
-            frame = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
-            frame_float = frame.astype(np.float32) / 255.0
+        matrix = _GRADE_MATRICES.get(style)
+        if matrix is not None:
+            # One saturating uint8 pass of the style's affine color matrix
+            return cv2.transform(frame, matrix)
         
-        elif style == 'warm':
-            # Warm, vintage look
-            frame_float[:, :, 2] = np.clip(frame_float[:, :, 2] * 1.1, 0, 1)  # Red
-            frame_float[:, :, 1] = np.clip(frame_float[:, :, 1] * 1.05, 0, 1) # Green
+        if style == 'desaturated':
+            # Reduce saturation for dramatic look: pull chroma 40% towards luma
+            luma = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            return cv2.addWeighted(frame, 0.6, np.broadcast_to(luma[:, :, np.newaxis], frame.shape), 0.4, 0)
         
-        return np.clip(frame_float * 255, 0, 255).astype(np.uint8)
+        return frame.copy()
 
     # ==================== Film & Grain ====================
 
@@ -123,58 +385,95 @@ class VFXProcessor:
             Frame with film grain
         """
         h, w = frame.shape[:2]
+        shape = (h, w, 3) if grain_color else (h, w)
         
-        # Generate grain
-        if grain_color:
-            grain = np.random.normal(0, grain_intensity * 50, (h, w, 3))
-        else:
-            grain = np.random.normal(0, grain_intensity * 50, (h, w, 1))
-            grain = np.repeat(grain, 3, axis=2)
+        # Generate grain into a reused float32 buffer
+        local = self._local
+        grain = getattr(local, 'grain_buf', None)
+        if grain is None or grain.shape != shape:
+            grain = local.grain_buf = np.empty(shape, dtype=np.float32)
         
-        # Apply Gaussian blur to grain for smoothness
-        grain = cv2.GaussianBlur(grain, (3, 3), 0)
+        # OpenCV's RNG is per-thread; mean/std are given per channel (a bare float
+        # would only fill channel 0 of a 3-channel buffer)
+        channels = shape[2] if grain_color else 1
+        cv2.randn(grain, (0.0,) * channels, (grain_intensity * 50,) * channels)
         
-        # Blend grain with frame
-        frame_float = frame.astype(np.float32)
-        output = frame_float + grain
+        # Smooth grain with the separable 3x3 Gaussian ([1, 2, 1] / 4 per axis)
+        grain = cv2.sepFilter2D(grain, -1, _GRAIN_KERNEL, _GRAIN_KERNEL)
+        if not grain_color:
+            # Stride-0 view over the single grain plane, no per-channel copy
+            grain = np.broadcast_to(grain[:, :, np.newaxis], frame.shape)
         
-        return np.clip(output, 0, 255).astype(np.uint8)
+        # Blend grain with frame, saturating to uint8
+        return cv2.add(frame, grain, dtype=cv2.CV_8U)
 
-    def apply_lens_distortion(self, frame: np.ndarray, distortion: float = 0.05) -> np.ndarray:
+    def _lens_distortion_maps(self, h: int, w: int,
+                              distortion: float) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Apply lens distortion effect.
+        Build (or fetch cached) fixed-point remap tables for a lens distortion.
         
         Args:
-            frame: Input frame
-            distortion: Distortion amount (positive=barrel, negative=pincushion)
+            h: Frame height
+            w: Frame width
+            distortion: Distortion amount
             
         Returns:
-            Distorted frame
+            (map1, map2) pair in CV_16SC2 / CV_16UC1 format for cv2.remap
         """
-        h, w = frame.shape[:2]
+        key = (h, w, round(distortion, 4))
+        maps = self._distort_cache.get(key)
+        if maps is not None:
+            return maps
         
-        # Create mesh grid
-        x, y = np.meshgrid(np.arange(w), np.arange(h))
+        with self._map_lock:
+            x_distorted, y_distorted = self._build_distortion_maps(h, w, distortion)
+            maps = cv2.convertMaps(x_distorted, y_distorted, cv2.CV_16SC2)
+        self._distort_cache[key] = maps
+        return maps
+
+    def _build_distortion_maps(self, h: int, w: int,
+                               distortion: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute float32 source-pixel maps for a lens distortion into reused buffers."""
+        # Normalized coordinates -1 to 1 as broadcastable float32 row/column vectors
+        x_norm = np.arange(w, dtype=np.float32)[np.newaxis, :] * np.float32(2.0 / w) - 1
+        y_norm = np.arange(h, dtype=np.float32)[:, np.newaxis] * np.float32(2.0 / h) - 1
         
-        # Normalize coordinates to -1 to 1
-        x_norm = (2 * x / w) - 1
-        y_norm = (2 * y / h) - 1
+        if self._map_buffers is None or self._map_buffers[0].shape != (h, w):
+            self._map_buffers = (np.empty((h, w), dtype=np.float32),
+                                 np.empty((h, w), dtype=np.float32))
+        x_distorted, y_distorted = self._map_buffers
         
-        # Apply distortion
-        r = np.sqrt(x_norm**2 + y_norm**2)
-        factor = 1 + distortion * r**2
+        # factor = 1 + distortion * r^2, built in the y buffer then applied to both axes
+        factor = y_distorted
+        np.add(x_norm * x_norm, y_norm * y_norm, out=factor)
+        factor *= np.float32(distortion)
+        factor += 1
+        np.multiply(x_norm, factor, out=x_distorted)
+        factor *= y_norm
         
-        x_distorted = (x_norm * factor * 0.5 + 0.5) * w
-        y_distorted = (y_norm * factor * 0.5 + 0.5) * h
+        # Back to pixel coordinates: (v * 0.5 + 0.5) * size
+        for buf, size in ((x_distorted, w), (y_distorted, h)):
+            buf *= np.float32(0.5 * size)
+            buf += np.float32(0.5 * size)
+            np.clip(buf, 0, size - 1, out=buf)
         
-        # Remap
-        x_distorted = np.clip(x_distorted, 0, w - 1)
-        y_distorted = np.clip(y_distorted, 0, h - 1)
+        return x_distorted, y_distorted
+
+    def apply_lens_distortion(self, frame: np.ndarray, distortion: float = 0.05) -> np.ndarray:
+        """
+        Apply lens distortion effect.
         
-        output = cv2.remap(frame, x_distorted.astype(np.float32), 
-                          y_distorted.astype(np.float32), cv2.INTER_LINEAR)
+        Args:
+            frame: Input frame
+            distortion: Distortion amount (positive=barrel, negative=pincushion)
+            
+        Returns:
+            Distorted frame
+        """
+        h, w = frame.shape[:2]
+        map1, map2 = self._lens_distortion_maps(h, w, distortion)
         
-        return output
+        return cv2.remap(frame, map1, map2, cv2.INTER_LINEAR)
 
     # ==================== Motion Effects ====================
 
@@ -191,17 +490,48 @@ class VFXProcessor:
         Returns:
             Motion-blurred frame
         """
+        kernel = self._motion_blur_kernel(direction, blur_amount)
+        return self._motion_blur(frame, direction, kernel)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _motion_blur_kernel(direction: str, blur_amount: int) -> np.ndarray:
+        """Build (once per direction and length) the normalized float32 motion kernel."""
         blur_amount = blur_amount if blur_amount % 2 == 1 else blur_amount + 1
         
         if direction == 'horizontal':
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (blur_amount, 1))
+            kernel = np.full((1, blur_amount), 1.0 / blur_amount, dtype=np.float32)
         elif direction == 'vertical':
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, blur_amount))
+            kernel = np.full((blur_amount, 1), 1.0 / blur_amount, dtype=np.float32)
         else:  # diagonal
             kernel = np.eye(blur_amount, dtype=np.float32) / blur_amount
+        kernel.flags.writeable = False
+        return kernel
+
+    @staticmethod
+    def _motion_blur(frame: np.ndarray, direction: str, kernel: np.ndarray) -> np.ndarray:
+        """Convolve with a motion kernel; axis-aligned ones use OpenCV's box filter."""
+        if direction in ('horizontal', 'vertical'):
+            h, w = kernel.shape
+            return cv2.blur(frame, (w, h))
+        return cv2.filter2D(frame, -1, kernel)
+
+    def apply_motion_blur_batch(self, frames: List[np.ndarray], direction: str = 'horizontal',
+                                blur_amount: int = 15) -> List[np.ndarray]:
+        """
+        Apply motion blur to several same-sized frames with a single filter call.
         
-        output = cv2.filter2D(frame, -1, kernel)
-        return output
+        Args:
+            frames: Input frames
+            direction: 'horizontal', 'vertical', or 'diagonal'
+            blur_amount: Amount of blur (odd number)
+            
+        Returns:
+            Motion-blurred frames
+        """
+        kernel = self._motion_blur_kernel(direction, blur_amount)
+        return self._filter_stacked(frames, kernel.shape[0] // 2,
+                                    lambda tall: self._motion_blur(tall, direction, kernel))
 
     def apply_chromatic_aberration(self, frame: np.ndarray, offset: int = 3) -> np.ndarray:
         """
@@ -214,13 +544,19 @@ class VFXProcessor:
         Returns:
             Frame with chromatic aberration
         """
-        b, g, r = cv2.split(frame)
+        offset %= frame.shape[1]
+        if offset == 0:
+            return frame.copy()
+        
+        output = np.empty_like(frame)
+        output[:, :, 1] = frame[:, :, 1]
         
-        # Shift channels
-        b_shifted = np.roll(b, offset, axis=1)
-        r_shifted = np.roll(r, -offset, axis=1)
+        # Shift channels (wrapping, like np.roll): blue right, red left
+        output[:, offset:, 0] = frame[:, :-offset, 0]
+        output[:, :offset, 0] = frame[:, -offset:, 0]
+        output[:, :-offset, 2] = frame[:, offset:, 2]
+        output[:, -offset:, 2] = frame[:, :offset, 2]
         
-        output = cv2.merge([b_shifted, g, r_shifted])
         return output
 
     # ==================== Edge & Detail Enhancement ====================
@@ -239,20 +575,72 @@ class VFXProcessor:
         Returns:
             Sharpened frame
         """
-        gaussian = cv2.GaussianBlur(frame, (radius * 2 + 1, radius * 2 + 1), 0)
+        kernel = _gaussian_kernel(radius)
+        gaussian = cv2.sepFilter2D(frame, -1, kernel, kernel)
         
-        frame_float = frame.astype(np.float32)
-        gaussian_float = gaussian.astype(np.float32)
-        
-        diff = frame_float - gaussian_float
+        if threshold <= 0:
+            # frame + amount * (frame - gaussian) as one saturating uint8 pass
+            return cv2.addWeighted(frame, 1.0 + amount, gaussian, -amount, 0)
         
-        if threshold > 0:
-            diff = np.where(np.abs(diff) >= threshold, diff, 0)
+        if NUMBA_AVAILABLE and frame.dtype == np.uint8:
+            frame = np.ascontiguousarray(frame)
+            out = np.empty_like(frame)
+            _unsharp_threshold_kernel(frame.reshape(-1), gaussian.reshape(-1),
+                                      amount, threshold, out.reshape(-1))
+            return out
         
+        frame_float = frame.astype(np.float32)
+        diff = frame_float - gaussian.astype(np.float32)
+        diff = np.where(np.abs(diff) >= threshold, diff, 0)
         output = frame_float + amount * diff
         
         return np.clip(output, 0, 255).astype(np.uint8)
 
+    def apply_unsharp_mask_batch(self, frames: List[np.ndarray], amount: float = 1.0,
+                                 radius: int = 1, threshold: int = 0) -> List[np.ndarray]:
+        """
+        Apply unsharp mask to several same-sized frames in one stacked pass.
+        
+        Args:
+            frames: Input frames
+            amount: Strength of sharpening
+            radius: Blur radius for unsharp mask
+            threshold: Minimum change to apply sharpening
+            
+        Returns:
+            Sharpened frames
+        """
+        return self._filter_stacked(
+            frames, radius,
+            lambda tall: self.apply_unsharp_mask(tall, amount, radius, threshold))
+
+    @staticmethod
+    def _filter_stacked(frames: List[np.ndarray], pad: int, filter_fn) -> List[np.ndarray]:
+        """
+        Run a neighbourhood filter once over frames stacked into a tall image.
+        
+        Each frame is reflect-padded by the kernel's vertical radius before
+        stacking, matching OpenCV's default BORDER_REFLECT_101, so rows never
+        blend across frame boundaries and results equal per-frame filtering.
+        
+        Args:
+            frames: Same-sized input frames
+            pad: Vertical kernel radius
+            filter_fn: Filter applied to the stacked image
+            
+        Returns:
+            Filtered frames (views into the stacked result)
+        """
+        if len(frames) == 1 or pad >= frames[0].shape[0]:
+            return [filter_fn(frame) for frame in frames]
+        
+        pad_width = ((pad, pad),) + ((0, 0),) * (frames[0].ndim - 1)
+        tall = np.concatenate([np.pad(frame, pad_width, mode='reflect') for frame in frames])
+        filtered = filter_fn(tall)
+        
+        step = frames[0].shape[0] + 2 * pad
+        return [filtered[i * step + pad:(i + 1) * step - pad] for i in range(len(frames))]
+
     def apply_edge_enhance(self, frame: np.ndarray, strength: float = 1.0) -> np.ndarray:
         """
         Apply edge enhancement effect.
@@ -264,19 +652,19 @@ class VFXProcessor:
         Returns:
             Edge-enhanced frame
         """
-        # Sobel edge detection
-        sobelx = cv2.Sobel(frame, cv2.CV_64F, 1, 0, ksize=3)
-        sobely = cv2.Sobel(frame, cv2.CV_64F, 0, 1, ksize=3)
-        edges = np.sqrt(sobelx**2 + sobely**2)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
         
-        # Normalize edges
-        edges = (edges / edges.max() * 255).astype(np.uint8)
+        # Sobel edge detection, |gx|/2 + |gy|/2 as an 8-bit magnitude
+        sobelx = cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3)
+        sobely = cv2.Sobel(gray, cv2.CV_16S, 0, 1, ksize=3)
+        edges = cv2.addWeighted(cv2.convertScaleAbs(sobelx), 0.5,
+                                cv2.convertScaleAbs(sobely), 0.5, 0)
         
-        # Blend with original
-        frame_float = frame.astype(np.float32)
-        output = frame_float + edges[:, :, np.newaxis] * strength * 0.1
+        if frame.ndim == 3:
+            edges = np.broadcast_to(edges[:, :, np.newaxis], frame.shape)
         
-        return np.clip(output, 0, 255).astype(np.uint8)
+        # Blend with original
+        return cv2.addWeighted(frame, 1.0, edges, strength * 0.1, 0)
 
     # ==================== Batch Processing ====================
 
@@ -296,7 +684,7 @@ class VFXProcessor:
         """
         logger.info(f"Processing video with VFX: {input_path}")
         
-        cap = cv2.VideoCapture(input_path)
+        cap = self._open_video_capture(input_path)
         if not cap.isOpened():
             raise ValueError(f"Cannot open video: {input_path}")
         
@@ -305,40 +693,19 @@ class VFXProcessor:
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            out = self._open_video_writer(output_path, fps, (width, height))
             
             frame_count = 0
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Apply color grading
-                if 'color_grade' in vfx_config:
-                    frame = self.apply_cinematic_color_grade(frame, vfx_config['color_grade'])
-                
-                # Apply grain
-                if 'grain' in vfx_config:
-                    frame = self.apply_film_grain(frame, vfx_config['grain'])
-                
-                # Apply sharpness
-                if 'sharpness' in vfx_config:
-                    frame = self.apply_unsharp_mask(frame, vfx_config['sharpness'])
-                
-                # Apply other effects
-                if 'distortion' in vfx_config:
-                    frame = self.apply_lens_distortion(frame, vfx_config['distortion'])
-                
-                if 'chromatic' in vfx_config:
-                    frame = self.apply_chromatic_aberration(frame, vfx_config['chromatic'])
-                
-                out.write(frame)
-                frame_count += 1
-                
-                if frame_count % 30 == 0:
-                    logger.info(f"Processed {frame_count} frames")
+            settings = _VFXSettings.from_config(vfx_config)
+            
+            with closing(self._iter_vfx_frames(cap, settings)) as frames:
+                for processed in frames:
+                    out.write(processed)
+                    frame_count += 1
+                    
+                    if frame_count % 30 == 0:
+                        logger.info(f"Processed {frame_count} frames")
             
             cap.release()
             out.release()
@@ -351,39 +718,186 @@ class VFXProcessor:
             logger.error(f"Error processing video: {e}")
             raise
 
+    @staticmethod
+    def _open_video_capture(input_path: str) -> cv2.VideoCapture:
+        """Open a capture on FFmpeg with hardware decoding when available (NVDEC/QSV/VAAPI)."""
+        if cv2.CAP_FFMPEG in cv2.videoio_registry.getStreamBackends():
+            cap = cv2.VideoCapture(input_path, cv2.CAP_FFMPEG,
+                                   [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            if cap.isOpened():
+                return cap
+        return cv2.VideoCapture(input_path)
 
-class BlenderParticleEffects:
-    """
-    Blender integration for particle effects (dust, smoke, etc).
-    This module generates Blender Python scripts to add particle effects.
-    """
+    @staticmethod
+    def _open_video_writer(output_path: str, fps: float,
+                           size: Tuple[int, int]) -> cv2.VideoWriter:
+        """
+        Open an H.264 writer with hardware encoding (NVENC/QSV/VAAPI) when the
+        FFmpeg backend supports it, falling back to the software mp4v writer.
+        """
+        if cv2.CAP_FFMPEG in cv2.videoio_registry.getWriterBackends():
+            out = cv2.VideoWriter(output_path, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*'avc1'),
+                                  fps, size,
+                                  [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+            if out.isOpened():
+                return out
+            logger.info("Hardware H.264 encoder unavailable, using mp4v")
+        
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        return cv2.VideoWriter(output_path, fourcc, fps, size)
 
-    def __init__(self, blender_python_path: Optional[str] = None):
+    def _iter_vfx_frames(self, cap: cv2.VideoCapture,
+                         settings: _VFXSettings) -> Iterator[np.ndarray]:
         """
-        Initialize Blender particle effects generator.
+        Decode, filter and yield frames in order with decode and filtering overlapped.
         
-        Args:
-            blender_python_path: Path to Blender's Python environment
+        A reader thread decodes batches of VFX_BATCH_SIZE frames into a bounded
+        queue, a pool of workers runs _apply_vfx_batch on them (OpenCV and numba
+        release the GIL), and results are yielded in submission order so the
+        caller can encode while later batches are still being filtered.
         """
-        self.blender_python_path = blender_python_path
-        logger.info("BlenderParticleEffects initialized")
+        batches: queue.Queue = queue.Queue(maxsize=VFX_QUEUE_SIZE)
+        stop = threading.Event()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def read_batches():
+            batch = []
+            try:
+                while not stop.is_set():
+                    ret, frame = cap.read()
+                    if ret:
+                        batch.append(frame)
+                    if batch and (not ret or len(batch) == VFX_BATCH_SIZE):
+                        if not put(batch):
+                            return
+                        batch = []
+                    if not ret:
+                        return
+            finally:
+                put(None)
+        
+        workers = max(1, (os.cpu_count() or 2) // 2)
+        reader = threading.Thread(target=read_batches, name="vfx-decode", daemon=True)
+        reader.start()
+        pending = deque()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vfx") as pool:
+                while True:
+                    batch = batches.get()
+                    if batch is None:
+                        break
+                    pending.append(pool.submit(self._apply_vfx_batch, batch, settings))
+                    if len(pending) > workers:
+                        yield from pending.popleft().result()
+                
+                while pending:
+                    yield from pending.popleft().result()
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
+            reader.join()
 
-    def generate_dust_particles_script(self, output_script: str, intensity: float = 1.0,
-                                       particle_count: int = 5000) -> str:
-        """
-        Generate Blender script for dust particle effects.
+    def _apply_vfx_batch(self, frames: List[np.ndarray],
+                         settings: _VFXSettings) -> List[np.ndarray]:
+        """Run the configured VFX chain over a batch of decoded frames."""
+        # Apply color grading
+        if settings.color_grade is not None:
+            frames = [self.apply_cinematic_color_grade(f, settings.color_grade) for f in frames]
         
-        Args:
-            output_script: Path to save script
-            intensity: Dust density (0-1)
-            particle_count: Number of particles
+        # Apply grain
+        if settings.grain is not None:
+            frames = [self.apply_film_grain(f, settings.grain) for f in frames]
+        
+        use_gpu = self._use_cuda and (settings.sharpness is not None
+                                      or settings.distortion is not None)
+        if use_gpu:
+            try:
+                frames = [self._apply_vfx_cuda(f, settings) for f in frames]
+            except (cv2.error, AttributeError) as e:
+                # AttributeError: CUDA runtime present but cudafilters/cudawarping not built
+                logger.warning(f"CUDA VFX path failed, falling back to CPU: {e}")
+                self._use_cuda = use_gpu = False
+        
+        if not use_gpu:
+            # Apply sharpness (stacked, one blur for the whole batch)
+            if settings.sharpness is not None:
+                frames = self.apply_unsharp_mask_batch(frames, settings.sharpness)
             
-        Returns:
-            Path to generated script
+            # Apply other effects
+            if settings.distortion is not None:
+                frames = [self.apply_lens_distortion(f, settings.distortion) for f in frames]
+        
+        if settings.chromatic is not None:
+            frames = [self.apply_chromatic_aberration(f, settings.chromatic) for f in frames]
+        
+        return frames
+
+    # ==================== CUDA ====================
+
+    def _apply_vfx_cuda(self, frame: np.ndarray, settings: _VFXSettings) -> np.ndarray:
+        """
+        Run the sharpen and distort stages on the GPU with one upload/download.
+        
+        CUDA filters take 1 or 4 channel images, so the frame is carried as
+        BGRA on the device.
         """
-        intensity = int(particle_count * intensity)
+        local = self._local
+        gpu_in = getattr(local, 'gpu_in', None)
+        if gpu_in is None:
+            gpu_in = local.gpu_in = cv2.cuda_GpuMat()
+        gpu_in.upload(frame)
+        gpu = cv2.cuda.cvtColor(gpu_in, cv2.COLOR_BGR2BGRA)
         
-        script = f'''#!/usr/bin/env python3
+        if settings.sharpness is not None:
+            gpu = self._apply_unsharp_cuda(gpu, settings.sharpness)
+        
+        if settings.distortion is not None:
+            gpu = self._apply_lens_distortion_cuda(gpu, settings.distortion)
+        
+        return cv2.cuda.cvtColor(gpu, cv2.COLOR_BGRA2BGR).download()
+
+    def _apply_unsharp_cuda(self, gpu_frame, amount: float = 1.0, radius: int = 1):
+        """Unsharp mask on a GpuMat (per-thread cached Gaussian filter + addWeighted)."""
+        filters = getattr(self._local, 'gpu_filters', None)
+        if filters is None:
+            filters = self._local.gpu_filters = {}
+        key = (gpu_frame.type(), radius)
+        gaussian = filters.get(key)
+        if gaussian is None:
+            ksize = radius * 2 + 1
+            gaussian = cv2.cuda.createGaussianFilter(gpu_frame.type(), -1, (ksize, ksize), 0)
+            filters[key] = gaussian
+        
+        blurred = gaussian.apply(gpu_frame)
+        return cv2.cuda.addWeighted(gpu_frame, 1.0 + amount, blurred, -amount, 0)
+
+    def _apply_lens_distortion_cuda(self, gpu_frame, distortion: float = 0.05):
+        """Lens distortion on a GpuMat with device-resident remap maps per resolution."""
+        w, h = gpu_frame.size()
+        key = (h, w, round(distortion, 4))
+        maps = self._gpu_distort_maps.get(key)
+        if maps is None:
+            with self._map_lock:
+                x_distorted, y_distorted = self._build_distortion_maps(h, w, distortion)
+                maps = (cv2.cuda_GpuMat(x_distorted), cv2.cuda_GpuMat(y_distorted))
+            self._gpu_distort_maps[key] = maps
+        
+        return cv2.cuda.remap(gpu_frame, maps[0], maps[1], cv2.INTER_LINEAR)
+
+
+# Particle effect scripts are parsed once at import and filled per call with
+# Template.substitute rather than rebuilt as f-strings on every call.
+DUST_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
 import bpy
 import random
 from mathutils import Vector
@@ -404,7 +918,7 @@ particle_modifier.particle_systems[0].settings = particle_settings
 
 # Configure particle settings
 ps = particle_settings
-ps.count = {intensity}
+ps.count = ${particle_count}
 ps.frame_start = 1
 ps.frame_end = 250
 ps.lifetime = 120
@@ -425,28 +939,11 @@ ps.brownian_factor = 0.5
 ps.render_type = 'COLLECTION'
 ps.use_collection_pick_random = False
 
-print("Dust particle system created with {{}} particles".format({intensity}))
+print("Dust particle system created with {} particles".format(${particle_count}))
 bpy.ops.wm.save_mainfile()
-'''
-        
-        with open(output_script, 'w') as f:
-            f.write(script)
-        
-        logger.info(f"Generated dust particles script: {output_script}")
-        return output_script
+''')
 
-    def generate_smoke_effects_script(self, output_script: str, intensity: float = 1.0) -> str:
-        """
-        Generate Blender script for smoke/exhaust effects.
-        
-        Args:
-            output_script: Path to save script
-            intensity: Smoke density (0-1)
-            
-        Returns:
-            Path to generated script
-        """
-        script = f'''#!/usr/bin/env python3
+SMOKE_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
 import bpy
 from mathutils import Vector
 
@@ -462,7 +959,7 @@ emitter.name = "SmokeEmitter"
 # Add smoke modifier
 smoke_mod = emitter.modifiers.new(name="SmokeModifier", type='SMOKE')
 smoke_mod.smoke_type = 'FLOW'
-smoke_mod.flow_settings.density = {intensity * 2}
+smoke_mod.flow_settings.density = ${density}
 smoke_mod.flow_settings.temperature = 2.0
 smoke_mod.flow_settings.velocity_factor = 0.5
 
@@ -476,33 +973,16 @@ smoke_domain.smoke_type = 'DOMAIN'
 
 # Domain settings
 domain_settings = smoke_domain.domain_settings
-domain_settings.resolution_max = int(64 * {intensity})
+domain_settings.resolution_max = int(64 * ${intensity})
 domain_settings.clipping = 0.001
 domain_settings.viscosity_base = 5.0
 domain_settings.viscosity_exponent = 5.0
 
-print("Smoke effect system created with intensity: {intensity}")
+print("Smoke effect system created with intensity: ${intensity}")
 bpy.ops.wm.save_mainfile()
-'''
-        
-        with open(output_script, 'w') as f:
-            f.write(script)
-        
-        logger.info(f"Generated smoke effects script: {output_script}")
-        return output_script
+''')
 
-    def generate_fire_effects_script(self, output_script: str, intensity: float = 1.0) -> str:
-        """
-        Generate Blender script for fire effects.
-        
-        Args:
-            output_script: Path to save script
-            intensity: Fire intensity (0-1)
-            
-        Returns:
-            Path to generated script
-        """
-        script = f'''#!/usr/bin/env python3
+FIRE_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
 import bpy
 
 # Clear default mesh
@@ -520,7 +1000,7 @@ particle_modifier = emitter.modifiers.new(name="FireModifier", type='PARTICLE_SY
 particle_modifier.particle_systems[0].settings = particle_settings
 
 ps = particle_settings
-ps.count = int(10000 * {intensity})
+ps.count = int(10000 * ${intensity})
 ps.frame_start = 1
 ps.frame_end = 250
 ps.lifetime = 60
@@ -535,43 +1015,11 @@ ps.angular_velocity_factor = 2.0
 # Render settings
 ps.render_type = 'OBJECT'
 
-print("Fire effect system created with intensity: {intensity}")
+print("Fire effect system created with intensity: ${intensity}")
 bpy.ops.wm.save_mainfile()
-'''
-        
-        with open(output_script, 'w') as f:
-            f.write(script)
-        
-        logger.info(f"Generated fire effects script: {output_script}")
-        return output_script
+''')
 
-    def generate_vehicle_effects_script(self, output_script: str, vehicle_type: str = 'truck',
-                                       intensity: float = 1.0) -> str:
-        """
-        Generate Blender script for vehicle-specific effects (exhaust, etc).
-        
-        Args:
-            output_script: Path to save script
-            vehicle_type: 'truck', 'forklift', etc
-            intensity: Effect intensity
-            
-        Returns:
-            Path to generated script
-        """
-        if vehicle_type.lower() == 'truck':
-            particle_count = int(3000 * intensity)
-            emitter_scale = 1.5
-            emitter_loc = Vector((0, 0, 3))
-        elif vehicle_type.lower() == 'forklift':
-            particle_count = int(1500 * intensity)
-            emitter_scale = 0.8
-            emitter_loc = Vector((0, 0, 1.5))
-        else:
-            particle_count = int(2000 * intensity)
-            emitter_scale = 1.0
-            emitter_loc = Vector((0, 0, 2))
-        
-        script = f'''#!/usr/bin/env python3
+VEHICLE_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
 import bpy
 from mathutils import Vector
 
@@ -580,18 +1028,18 @@ bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Create exhaust emitter
-bpy.ops.mesh.primitive_cylinder_add(radius={emitter_scale * 0.3}, depth=0.5, 
-                                    location=Vector((0, 0, 3)))
+bpy.ops.mesh.primitive_cylinder_add(radius=${radius}, depth=0.5, 
+                                    location=Vector(${emitter_loc}))
 emitter = bpy.context.active_object
-emitter.name = "{vehicle_type}_ExhaustEmitter"
+emitter.name = "${vehicle_type}_ExhaustEmitter"
 
 # Add particle system
-particle_settings = bpy.data.particles.new(name="{vehicle_type}_Exhaust")
+particle_settings = bpy.data.particles.new(name="${vehicle_type}_Exhaust")
 particle_modifier = emitter.modifiers.new(name="ExhaustModifier", type='PARTICLE_SYSTEM')
 particle_modifier.particle_systems[0].settings = particle_settings
 
 ps = particle_settings
-ps.count = {particle_count}
+ps.count = ${particle_count}
 ps.frame_start = 1
 ps.frame_end = 250
 ps.lifetime = 100
@@ -601,19 +1049,231 @@ ps.lifetime_random = 0.4
 ps.damping = 0.2
 ps.mass = 0.8
 ps.drag_factor = 0.2
-ps.brown_ponent = 0.1
+ps.brownian_factor = 0.1
 ps.effector_weights.gravity = 0.3
 
 # Velocity
 ps.initial_velocity_factor = 2.0
 ps.velocity_factor_random = 0.3
 
-print("{vehicle_type} exhaust effect created with {{}} particles".format({particle_count}))
+print("${vehicle_type} exhaust effect created with {} particles".format(${particle_count}))
+bpy.ops.wm.save_mainfile()
+''')
+
+
+BATCH_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
+import bpy
+from mathutils import Vector
+
+# Clear default mesh
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete()
+
+SPECS = ${specs}
+
+for spec in SPECS:
+    # Create emitter
+    if spec['primitive'] == 'cylinder':
+        bpy.ops.mesh.primitive_cylinder_add(radius=spec['size'], depth=0.5,
+                                            location=Vector(spec['location']))
+    else:
+        bpy.ops.mesh.primitive_cube_add(size=spec['size'], location=Vector(spec['location']))
+    emitter = bpy.context.active_object
+    emitter.name = spec['name'] + "Emitter"
+
+    # Add particle system
+    particle_settings = bpy.data.particles.new(name=spec['name'])
+    particle_modifier = emitter.modifiers.new(name=spec['name'] + "Modifier", type='PARTICLE_SYSTEM')
+    particle_modifier.particle_systems[0].settings = particle_settings
+
+    ps = particle_settings
+    ps.count = spec['count']
+    ps.frame_start = spec['frame_start']
+    ps.frame_end = spec['frame_end']
+    ps.lifetime = spec['lifetime']
+    ps.lifetime_random = spec['lifetime_random']
+
+    # Remaining settings, dotted names reach nested structs (effector_weights.gravity)
+    for attr, value in spec['settings'].items():
+        target = ps
+        *path, leaf = attr.split('.')
+        for part in path:
+            target = getattr(target, part)
+        setattr(target, leaf, value)
+
+print("Created {} particle emitters".format(len(SPECS)))
 bpy.ops.wm.save_mainfile()
-'''
+''')
+
+# Exhaust presets per vehicle type: (particles at intensity 1, emitter scale, emitter location)
+_VEHICLE_EXHAUST: Dict[str, Tuple[int, float, Tuple[float, float, float]]] = {
+    'truck': (3000, 1.5, (0, 0, 3)),
+    'forklift': (1500, 0.8, (0, 0, 1.5)),
+}
+_DEFAULT_EXHAUST = (2000, 1.0, (0, 0, 2))
+
+
+@dataclass
+class ParticleSpec:
+    """One particle-system emitter in a batched Blender effects script."""
+    name: str
+    count: int
+    lifetime: int
+    lifetime_random: float = 0.0
+    primitive: str = 'cube'  # 'cube' or 'cylinder'
+    size: float = 1.0  # cube size or cylinder radius
+    location: Tuple[float, float, float] = (0, 0, 0)
+    frame_start: int = 1
+    frame_end: int = 250
+    settings: Dict[str, Any] = field(default_factory=dict)  # extra ParticleSettings attributes
+
+class BlenderParticleEffects:
+    """
+    Blender integration for particle effects (dust, smoke, etc).
+    This module generates Blender Python scripts to add particle effects.
+    """
+
+    def __init__(self, blender_python_path: Optional[str] = None):
+        """
+        Initialize Blender particle effects generator.
+        
+        Args:
+            blender_python_path: Path to Blender's Python environment
+        """
+        self.blender_python_path = blender_python_path
+        logger.info("BlenderParticleEffects initialized")
+
+    def generate_dust_particles_script(self, output_script: str, intensity: float = 1.0,
+                                       particle_count: int = 5000) -> str:
+        """
+        Generate Blender script for dust particle effects.
+        
+        Args:
+            output_script: Path to save script
+            intensity: Dust density (0-1)
+            particle_count: Number of particles
+            
+        Returns:
+            Path to generated script
+        """
+        script = DUST_SCRIPT_TEMPLATE.substitute(particle_count=int(particle_count * intensity))
+        Path(output_script).write_text(script)
         
-        with open(output_script, 'w') as f:
-            f.write(script)
+        logger.info(f"Generated dust particles script: {output_script}")
+        return output_script
+
+    def generate_smoke_effects_script(self, output_script: str, intensity: float = 1.0) -> str:
+        """
+        Generate Blender script for smoke/exhaust effects.
+        
+        Args:
+            output_script: Path to save script
+            intensity: Smoke density (0-1)
+            
+        Returns:
+            Path to generated script
+        """
+        script = SMOKE_SCRIPT_TEMPLATE.substitute(intensity=intensity, density=intensity * 2)
+        Path(output_script).write_text(script)
+        
+        logger.info(f"Generated smoke effects script: {output_script}")
+        return output_script
+
+    def generate_fire_effects_script(self, output_script: str, intensity: float = 1.0) -> str:
+        """
+        Generate Blender script for fire effects.
+        
+        Args:
+            output_script: Path to save script
+            intensity: Fire intensity (0-1)
+            
+        Returns:
+            Path to generated script
+        """
+        script = FIRE_SCRIPT_TEMPLATE.substitute(intensity=intensity)
+        Path(output_script).write_text(script)
+        
+        logger.info(f"Generated fire effects script: {output_script}")
+        return output_script
+
+    def generate_vehicle_effects_script(self, output_script: str, vehicle_type: str = 'truck',
+                                       intensity: float = 1.0) -> str:
+        """
+        Generate Blender script for vehicle-specific effects (exhaust, etc).
+        
+        Args:
+            output_script: Path to save script
+            vehicle_type: 'truck', 'forklift', etc
+            intensity: Effect intensity
+            
+        Returns:
+            Path to generated script
+        """
+        base_count, emitter_scale, emitter_loc = _VEHICLE_EXHAUST.get(
+            vehicle_type.lower(), _DEFAULT_EXHAUST)
+        particle_count = int(base_count * intensity)
+        
+        script = VEHICLE_SCRIPT_TEMPLATE.substitute(
+            vehicle_type=vehicle_type,
+            particle_count=particle_count,
+            radius=emitter_scale * 0.3,
+            emitter_loc=emitter_loc,
+        )
+        Path(output_script).write_text(script)
         
         logger.info(f"Generated {vehicle_type} effects script: {output_script}")
         return output_script
+
+    # ==================== Batched Scripts ====================
+
+    @staticmethod
+    def dust_spec(intensity: float = 1.0, particle_count: int = 5000) -> ParticleSpec:
+        """ParticleSpec matching generate_dust_particles_script."""
+        return ParticleSpec(
+            name="Dust", count=int(particle_count * intensity), lifetime=120,
+            lifetime_random=0.3, size=10,
+            settings={'emit_from': 'FACE', 'use_rotations': True, 'angular_velocity_factor': 0.5,
+                      'mass': 1.0, 'damping': 0.3, 'drag_factor': 0.15, 'brownian_factor': 0.5,
+                      'render_type': 'COLLECTION', 'use_collection_pick_random': False},
+        )
+
+    @staticmethod
+    def fire_spec(intensity: float = 1.0) -> ParticleSpec:
+        """ParticleSpec matching generate_fire_effects_script."""
+        return ParticleSpec(
+            name="Fire", count=int(10000 * intensity), lifetime=60, lifetime_random=0.2, size=2,
+            settings={'damping': 0.1, 'mass': 0.5, 'use_rotations': True,
+                      'angular_velocity_factor': 2.0, 'render_type': 'OBJECT'},
+        )
+
+    @staticmethod
+    def vehicle_exhaust_spec(vehicle_type: str = 'truck', intensity: float = 1.0) -> ParticleSpec:
+        """ParticleSpec matching generate_vehicle_effects_script."""
+        base_count, emitter_scale, emitter_loc = _VEHICLE_EXHAUST.get(
+            vehicle_type.lower(), _DEFAULT_EXHAUST)
+        return ParticleSpec(
+            name=f"{vehicle_type}_Exhaust", count=int(base_count * intensity), lifetime=100,
+            lifetime_random=0.4, primitive='cylinder', size=emitter_scale * 0.3,
+            location=emitter_loc,
+            settings={'damping': 0.2, 'mass': 0.8, 'drag_factor': 0.2, 'brownian_factor': 0.1,
+                      'effector_weights.gravity': 0.3, 'initial_velocity_factor': 2.0,
+                      'velocity_factor_random': 0.3},
+        )
+
+    def generate_batch_script(self, output_script: str, specs: List[ParticleSpec]) -> str:
+        """
+        Generate one Blender script that creates several particle emitters, so
+        a batch of effects costs a single Blender launch instead of one each.
+        
+        Args:
+            output_script: Path to save script
+            specs: Emitters to create, e.g. from dust_spec / vehicle_exhaust_spec
+            
+        Returns:
+            Path to generated script
+        """
+        script = BATCH_SCRIPT_TEMPLATE.substitute(specs=repr([asdict(spec) for spec in specs]))
+        Path(output_script).write_text(script)
+        
+        logger.info(f"Generated batch effects script ({len(specs)} emitters): {output_script}")
+        return output_script
@@ -3,16 +3,99 @@ Warehouse Assets Manager - Manages 3D assets for the Saipooja Warehouse project.
 Handles inventory of forklifts, medicine boxes, container trucks, and other warehouse equipment.
 """
 
+import copy
+import io
 import os
+import sys
 import json
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
 import logging
 from pathlib import Path
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Blender setup script pieces; the asset record is formatted once per placement
+_SETUP_SCRIPT_HEADER = '''#!/usr/bin/env python3
+import bpy
+import json
+import os
+
+# Scene setup for: {scene_name}
+
+# Clear default scene
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete()
+
+# Create world/scene properties
+scene = bpy.context.scene
+scene.name = "{scene_name}"
+scene.render.fps = {frame_rate}
+scene.render.resolution_x = {resolution_x}
+scene.render.resolution_y = {resolution_y}
+
+# Setup lighting
+sun_data = bpy.data.lights.new(name="Sun", type='SUN')
+sun_data.energy = {sun_strength}
+sun_object = bpy.data.objects.new("Sun", sun_data)
+bpy.context.collection.objects.link(sun_object)
+sun_object.location = {sun_location}
+
+# Setup camera
+camera_data = bpy.data.cameras.new(name="Camera")
+camera_object = bpy.data.objects.new("Camera", camera_data)
+bpy.context.collection.objects.link(camera_object)
+camera_object.location = {camera_location}
+camera_object.rotation_euler = {camera_rotation}
+scene.camera = camera_object
+
+# Assets configuration
+assets_to_load = [
+'''
+
+_SETUP_ASSET_TMPL = '''    {{
+        'name': '{name}',
+        'type': '{type}',
+        'path': '{path}',
+        'location': {location},
+        'rotation': {rotation},
+        'scale': {scale},
+    }},
+'''
+
+_SETUP_SCRIPT_FOOTER = '''
+]
+
+# Load and position assets
+for asset_config in assets_to_load:
+    try:
+        # Import asset (append from .blend file)
+        with bpy.data.libraries.load(asset_config['path'], link=False) as (data_from, data_to):
+            data_to.objects = data_from.objects
+        
+        # Place object
+        obj = data_to.objects[0]
+        bpy.context.collection.objects.link(obj)
+        obj.location = asset_config['location']
+        obj.rotation_euler = asset_config['rotation']
+        obj.scale = asset_config['scale']
+        
+        print(f"Loaded: {asset_config['name']}")
+    except Exception as e:
+        print(f"Error loading {asset_config['name']}: {e}")
+
+print("Warehouse scene setup complete!")
+bpy.ops.wm.save_mainfile()
+'''
+
 
 class AssetType(Enum):
     """Enum for asset types."""
@@ -27,7 +110,7 @@ class AssetType(Enum):
     PARTICLE_SYSTEM = "particle_system"
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset3D:
     """Represents a 3D asset."""
     asset_id: str
@@ -42,27 +125,75 @@ class Asset3D:
     physics_enabled: bool = False
     animation_path: Optional[str] = None
     metadata: Dict = None
+    # Memoized to_dict() result, cleared by invalidate_dict() when the asset changes
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        d = asdict(self)
-        d['asset_type'] = self.asset_type.value
+        """
+        Convert to dictionary.
+        
+        The immutable fields are built once and cached; every call returns a new
+        dict with its own deep copy of metadata, so callers may modify the result.
+        """
+        if self._dict_cache is None:
+            d = {name: getattr(self, name) for name in _ASSET_FIELDS if name != 'metadata'}
+            d['asset_type'] = self.asset_type.value
+            self._dict_cache = d
+        d = dict(self._dict_cache)
+        d['metadata'] = copy.deepcopy(self.metadata)
         return d
 
+    def invalidate_dict(self):
+        """Drop the cached to_dict() result after a field change."""
+        self._dict_cache = None
+
 
-@dataclass
+# Serialized Asset3D fields in declaration order (the init=False cache slot is left out)
+_ASSET_FIELDS = tuple(f.name for f in fields(Asset3D) if f.init)
+
+
+@dataclass(slots=True)
 class WarehouseScene:
     """Represents a warehouse scene configuration."""
     scene_name: str
     scene_id: str
     description: str
-    assets: List[Asset3D]
+    assets: List[Asset3D] = field(default_factory=list)
     duration: float = 5.0  # Duration in seconds
     frame_rate: int = 30
     resolution: Tuple[int, int] = (1920, 1080)
     lighting_config: Dict = None
     camera_config: Dict = None
     physics_enabled: bool = True
+    # Memoized as_arrays() result, cleared by invalidate_arrays() when the asset list changes
+    _soa_cache: Optional[Dict[str, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Column view of the placed assets for vectorized queries.
+        
+        Returns:
+            Read-only arrays: positions, rotations, scales as (N, 3) float32 and
+            type_codes as (N,) int8 indices into AssetType
+        """
+        if self._soa_cache is None:
+            n = len(self.assets)
+            vec3 = np.dtype((np.float32, 3))
+            type_index = {t: i for i, t in enumerate(AssetType)}
+            arrays = {
+                'positions': np.fromiter((a.position for a in self.assets), dtype=vec3, count=n),
+                'rotations': np.fromiter((a.rotation for a in self.assets), dtype=vec3, count=n),
+                'scales': np.fromiter((a.scale for a in self.assets), dtype=vec3, count=n),
+                'type_codes': np.fromiter((type_index[a.asset_type] for a in self.assets), dtype=np.int8, count=n),
+            }
+            for arr in arrays.values():
+                arr.flags.writeable = False
+            self._soa_cache = arrays
+        return self._soa_cache
+
+    def invalidate_arrays(self):
+        """Drop the cached as_arrays() result after the asset list changes."""
+        self._soa_cache = None
 
 
 class WarehouseAssetsManager:
@@ -71,6 +202,9 @@ class WarehouseAssetsManager:
     Handles asset inventory, scene creation, and asset configuration.
     """
 
+    # <project root>/assets/models, resolved on first use and shared by all instances
+    _DEFAULT_ASSETS_DIR: Optional[str] = None
+
     def __init__(self, assets_dir: Optional[str] = None):
         """
         Initialize warehouse assets manager.
@@ -79,13 +213,15 @@ class WarehouseAssetsManager:
             assets_dir: Directory to store asset data
         """
         if assets_dir is None:
-            assets_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                'assets', 'models'
-            )
+            cls = type(self)
+            if cls._DEFAULT_ASSETS_DIR is None:
+                cls._DEFAULT_ASSETS_DIR = str(Path(__file__).resolve().parents[2] / 'assets' / 'models')
+            assets_dir = cls._DEFAULT_ASSETS_DIR
         
         self.assets_dir = assets_dir
         self.asset_registry: Dict[str, Asset3D] = {}
+        # Secondary index for type lookups; asset_type is not updatable, so it never goes stale
+        self._assets_by_type: Dict[AssetType, List[Asset3D]] = {t: [] for t in AssetType}
         self.scenes: Dict[str, WarehouseScene] = {}
         
         os.makedirs(assets_dir, exist_ok=True)
@@ -166,8 +302,7 @@ class WarehouseAssetsManager:
         ]
         
         for asset in default_assets:
-            self.asset_registry[asset.asset_id] = asset
-            logger.info(f"Registered asset: {asset.name} ({asset.asset_id})")
+            self.register_asset(asset)
 
     def register_asset(self, asset: Asset3D) -> bool:
         """
@@ -183,8 +318,16 @@ class WarehouseAssetsManager:
             logger.warning(f"Asset with ID '{asset.asset_id}' already exists")
             return False
         
+        # Many assets share a model/texture file; keep one copy of each path string
+        asset.model_path = sys.intern(asset.model_path)
+        if asset.texture_path:
+            asset.texture_path = sys.intern(asset.texture_path)
+        if asset.animation_path:
+            asset.animation_path = sys.intern(asset.animation_path)
+        
         self.asset_registry[asset.asset_id] = asset
-        logger.info(f"Registered asset: {asset.name}")
+        self._assets_by_type[asset.asset_type].append(asset)
+        logger.info(f"Registered asset: {asset.name} ({asset.asset_id})")
         return True
 
     def get_asset(self, asset_id: str) -> Optional[Asset3D]:
@@ -209,8 +352,7 @@ class WarehouseAssetsManager:
         Returns:
             List of matching assets
         """
-        return [asset for asset in self.asset_registry.values() 
-                if asset.asset_type == asset_type]
+        return list(self._assets_by_type[asset_type])
 
     def update_asset(self, asset_id: str, **kwargs) -> bool:
         """
@@ -234,6 +376,7 @@ class WarehouseAssetsManager:
         for key, value in kwargs.items():
             if key in allowed_fields:
                 setattr(asset, key, value)
+        asset.invalidate_dict()
         
         logger.info(f"Updated asset: {asset_id}")
         return True
@@ -275,6 +418,20 @@ class WarehouseAssetsManager:
         logger.info(f"Created scene: {scene_name}")
         return scene
 
+    @staticmethod
+    def _scene_copy(asset: Asset3D,
+                    position: Optional[Tuple[float, float, float]] = None,
+                    rotation: Optional[Tuple[float, float, float]] = None,
+                    scale: Optional[Tuple[float, float, float]] = None) -> Asset3D:
+        """Copy of a registered asset for placement in a scene, with optional overrides."""
+        return replace(
+            asset,
+            scale=scale or asset.scale,
+            position=position or asset.position,
+            rotation=rotation or asset.rotation,
+            metadata=asset.metadata.copy() if asset.metadata else {}
+        )
+
     def add_asset_to_scene(self, scene_id: str, asset_id: str,
                           position: Optional[Tuple[float, float, float]] = None,
                           rotation: Optional[Tuple[float, float, float]] = None,
@@ -301,27 +458,51 @@ class WarehouseAssetsManager:
             return False
         
         asset = self.asset_registry[asset_id]
-        
-        # Create copy with custom properties
-        scene_asset = Asset3D(
-            asset_id=asset.asset_id,
-            name=asset.name,
-            asset_type=asset.asset_type,
-            model_path=asset.model_path,
-            scale=scale or asset.scale,
-            position=position or asset.position,
-            rotation=rotation or asset.rotation,
-            texture_path=asset.texture_path,
-            material_name=asset.material_name,
-            physics_enabled=asset.physics_enabled,
-            animation_path=asset.animation_path,
-            metadata=asset.metadata.copy() if asset.metadata else {}
-        )
+        scene_asset = self._scene_copy(asset, position, rotation, scale)
         
         self.scenes[scene_id].assets.append(scene_asset)
+        self.scenes[scene_id].invalidate_arrays()
         logger.info(f"Added {asset.name} to scene {scene_id}")
         return True
 
+    def add_assets_to_scene(self, scene_id: str, entries: List[Dict]) -> bool:
+        """
+        Add several assets to a scene in one pass.
+        
+        Args:
+            scene_id: Scene to add to
+            entries: Dicts with 'asset_id' and optional 'position', 'rotation', 'scale'
+                overrides, as accepted by add_asset_to_scene
+        
+        Returns:
+            Success status; nothing is added if any entry is malformed or its asset ID is unknown
+        """
+        if scene_id not in self.scenes:
+            logger.error(f"Scene not found: {scene_id}")
+            return False
+        
+        malformed = [e for e in entries if not isinstance(e, dict) or e.get('asset_id') is None]
+        if malformed:
+            logger.error(f"Entries without an asset_id: {malformed}")
+            return False
+        
+        missing = [e['asset_id'] for e in entries if e['asset_id'] not in self.asset_registry]
+        if missing:
+            logger.error(f"Assets not found: {', '.join(missing)}")
+            return False
+        
+        scene_assets = [
+            self._scene_copy(self.asset_registry[e['asset_id']],
+                             e.get('position'), e.get('rotation'), e.get('scale'))
+            for e in entries
+        ]
+        
+        scene = self.scenes[scene_id]
+        scene.assets.extend(scene_assets)
+        scene.invalidate_arrays()
+        logger.info(f"Added {len(scene_assets)} assets to scene {scene_id}")
+        return True
+
     def remove_asset_from_scene(self, scene_id: str, asset_id: str) -> bool:
         """
         Remove an asset from a scene.
@@ -340,6 +521,7 @@ class WarehouseAssetsManager:
         scene = self.scenes[scene_id]
         initial_count = len(scene.assets)
         scene.assets = [a for a in scene.assets if a.asset_id != asset_id]
+        scene.invalidate_arrays()
         
         if len(scene.assets) < initial_count:
             logger.info(f"Removed asset {asset_id} from scene {scene_id}")
@@ -377,7 +559,9 @@ class WarehouseAssetsManager:
         
         scene = self.scenes[scene_id]
         
-        config = {
+        # Everything except the asset list; assets are streamed one record at a time
+        # so the full document never has to exist in memory
+        header = {
             'scene_name': scene.scene_name,
             'scene_id': scene.scene_id,
             'description': scene.description,
@@ -386,18 +570,56 @@ class WarehouseAssetsManager:
             'resolution': scene.resolution,
             'lighting': scene.lighting_config,
             'camera': scene.camera_config,
-            'assets': [asset.to_dict() for asset in scene.assets]
         }
         
         try:
-            with open(output_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            if ORJSON_AVAILABLE:
+                option = orjson.OPT_NON_STR_KEYS
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(header, option=option)[:-1] + b',"assets":[')
+                    for i, asset in enumerate(scene.assets):
+                        if i:
+                            f.write(b',\n')
+                        f.write(orjson.dumps(asset.to_dict(), option=option))
+                    f.write(b']}')
+            else:
+                with open(output_path, 'w') as f:
+                    f.write(json.dumps(header)[:-1] + ', "assets": [')
+                    for i, asset in enumerate(scene.assets):
+                        if i:
+                            f.write(',\n')
+                        f.write(json.dumps(asset.to_dict()))
+                    f.write(']}')
             logger.info(f"Exported scene config: {output_path}")
             return True
         except Exception as e:
             logger.error(f"Error exporting scene: {e}")
             return False
 
+    def get_scene_transforms(self, scene_id: str) -> Optional[np.ndarray]:
+        """
+        Build world matrices for every asset placed in a scene.
+        
+        Args:
+            scene_id: Scene to build transforms for
+            
+        Returns:
+            (N, 4, 4) float32 array of TRS matrices in scene order, or None
+        """
+        if scene_id not in self.scenes:
+            logger.error(f"Scene not found: {scene_id}")
+            return None
+        
+        # Deferred: importing the kernel loads numba, which most users of this module never need
+        from ._transforms_numba import build_transforms
+        
+        arrays = self.scenes[scene_id].as_arrays()
+        pos = arrays['positions']
+        
+        out = np.empty((len(pos), 4, 4), dtype=np.float32)
+        build_transforms(pos, arrays['rotations'], arrays['scales'], out)
+        return out
+
     def generate_blender_setup_script(self, scene_id: str, output_script: str) -> bool:
         """
         Generate Blender Python script to set up scene.
@@ -415,82 +637,33 @@ class WarehouseAssetsManager:
         
         scene = self.scenes[scene_id]
         
-        script = f'''#!/usr/bin/env python3
-import bpy
-import json
-import os
-
-# Scene setup for: {scene.scene_name}
-
-# Clear default scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
-
-# Create world/scene properties
-scene = bpy.context.scene
-scene.name = "{scene.scene_name}"
-scene.render.fps = {scene.frame_rate}
-scene.render.resolution_x = {scene.resolution[0]}
-scene.render.resolution_y = {scene.resolution[1]}
-
-# Setup lighting
-sun_data = bpy.data.lights.new(name="Sun", type='SUN')
-sun_data.energy = {scene.lighting_config.get('sun_strength', 1.5)}
-sun_object = bpy.data.objects.new("Sun", sun_data)
-bpy.context.collection.objects.link(sun_object)
-sun_object.location = {tuple(scene.lighting_config.get('sun_direction', (1, 1, 1)))}
-
-# Setup camera
-camera_data = bpy.data.cameras.new(name="Camera")
-camera_object = bpy.data.objects.new("Camera", camera_data)
-bpy.context.collection.objects.link(camera_object)
-camera_object.location = {tuple(scene.camera_config.get('location', (10, 10, 5)))}
-camera_object.rotation_euler = {tuple(scene.camera_config.get('rotation', (1.1, 0, 0.785)))}
-scene.camera = camera_object
-
-# Assets configuration
-assets_to_load = [
-'''
+        buf = io.StringIO()
+        buf.write(_SETUP_SCRIPT_HEADER.format(
+            scene_name=scene.scene_name,
+            frame_rate=scene.frame_rate,
+            resolution_x=scene.resolution[0],
+            resolution_y=scene.resolution[1],
+            sun_strength=scene.lighting_config.get('sun_strength', 1.5),
+            sun_location=tuple(scene.lighting_config.get('sun_direction', (1, 1, 1))),
+            camera_location=tuple(scene.camera_config.get('location', (10, 10, 5))),
+            camera_rotation=tuple(scene.camera_config.get('rotation', (1.1, 0, 0.785)))
+        ))
         
         for asset in scene.assets:
-            script += f'''    {{
-        'name': '{asset.name}',
-        'type': '{asset.asset_type.value}',
-        'path': '{asset.model_path}',
-        'location': {asset.position},
-        'rotation': {asset.rotation},
-        'scale': {asset.scale},
-    }},
-'''
-        
-        script += f'''
-]
-
-# Load and position assets
-for asset_config in assets_to_load:
-    try:
-        # Import asset (append from .blend file)
-        with bpy.data.libraries.load(asset_config['path'], link=False) as (data_from, data_to):
-            data_to.objects = data_from.objects
-        
-        # Place object
-        obj = data_to.objects[0]
-        bpy.context.collection.objects.link(obj)
-        obj.location = asset_config['location']
-        obj.rotation_euler = asset_config['rotation']
-        obj.scale = asset_config['scale']
+            buf.write(_SETUP_ASSET_TMPL.format(
+                name=asset.name,
+                type=asset.asset_type.value,
+                path=asset.model_path,
+                location=asset.position,
+                rotation=asset.rotation,
+                scale=asset.scale
+            ))
         
-        print(f"Loaded: {{asset_config['name']}}")
-    except Exception as e:
-        print(f"Error loading {{asset_config['name']}}: {{e}}")
-
-print("Warehouse scene setup complete!")
-bpy.ops.wm.save_mainfile()
-'''
+        buf.write(_SETUP_SCRIPT_FOOTER)
         
         try:
             with open(output_script, 'w') as f:
-                f.write(script)
+                f.write(buf.getvalue())
             logger.info(f"Generated Blender setup script: {output_script}")
             return True
         except Exception as e:
@@ -530,14 +703,7 @@ bpy.ops.wm.save_mainfile()
         Returns:
             Dictionary with asset statistics
         """
-        stats = {
+        return {
             'total_assets': len(self.asset_registry),
-            'by_type': {}
+            'by_type': {t.value: len(assets) for t, assets in self._assets_by_type.items() if assets}
         }
-        
-        for asset_type in AssetType:
-            count = len(self.get_assets_by_type(asset_type))
-            if count > 0:
-                stats['by_type'][asset_type.value] = count
-        
-        return stats
@@ -1,20 +1,52 @@
 import os
+from collections import namedtuple
+from functools import lru_cache
 from dotenv import load_dotenv
-import google.generativeai as genai
 
 # Load environment variables
 load_dotenv()
 
-# Get the API key from environment
-api_key = os.getenv("GEMINI_API_KEY")
-if not api_key:
-    raise ValueError("GEMINI_API_KEY not found in environment variables. Please set it in a .env file.")
+# The GenAI SDK (gRPC, protobuf) is only imported and configured on first use
+_configured = False
 
-genai.configure(api_key=api_key)
+def _ensure_configured():
+    """
+    Import and configure the Gemini SDK once, on first code generation.
+    """
+    global _configured
+    import google.generativeai as genai
+    if not _configured:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables. Please set it in a .env file.")
+        genai.configure(api_key=api_key)
+        _configured = True
+    return genai
+
+@lru_cache(maxsize=4)
+def _get_model(name):
+    """
+    Return a shared GenerativeModel so repeat calls reuse its client state.
+    """
+    return _ensure_configured().GenerativeModel(name)
+
+BLENDER_PROMPT_PREFIX = """You are a Blender Python expert. Convert the following scene into bpy code for Eevee engine. Include:
+- Scene setup
+- Camera placement
+- Lighting
+- Basic objects
+- Eevee render settings
+Return ONLY the code.
+
+Scene: """
+
+HardwareInfo = namedtuple('HardwareInfo', ['system', 'cpu_count', 'ram_gb', 'gpu_name'])
 
+@lru_cache(maxsize=1)
 def check_hardware_compatibility():
     """
     Check system compatibility for Blender rendering.
+    The probe runs once per process; later calls return the cached HardwareInfo.
     """
     import platform
     import psutil
@@ -25,32 +57,32 @@ def check_hardware_compatibility():
     if ram < 8:
         print("Warning: Low RAM detected. Rendering may be slow.")
     # Check for GPU if possible
+    gpu_name = None
     try:
         import GPUtil
         gpus = GPUtil.getGPUs()
         if gpus:
-            print(f"GPU detected: {gpus[0].name}")
+            gpu_name = gpus[0].name
+            print(f"GPU detected: {gpu_name}")
         else:
             print("No GPU detected, using CPU.")
     except ImportError:
         print("GPUtil not installed, skipping GPU check.")
-    return True
+    except Exception as e:
+        print(f"GPU check failed ({e}), using CPU.")
+    return HardwareInfo(system, cpu_count, ram, gpu_name)
 
-def generate_blender_code(script):
+def generate_blender_code(script, on_chunk=None):
     """
     Main function to convert movie script to Blender Python (bpy) commands using Gemini API.
+    The response is streamed; on_chunk, if given, is called with the number of chunks received so far.
     """
-    prompt = f"""You are a Blender Python expert. Convert the following scene into bpy code for Eevee engine. Include:
-- Scene setup
-- Camera placement
-- Lighting
-- Basic objects
-- Eevee render settings
-Return ONLY the code.
-
-Scene: {script}"""
-
-    model = genai.GenerativeModel('gemini-1.5-pro')
-    response = model.generate_content(prompt)
-    bpy_code = response.text.strip()
-    return bpy_code
\ No newline at end of file
+    prompt = BLENDER_PROMPT_PREFIX + script
+    model = _get_model('gemini-1.5-pro')
+    chunks = []
+    for chunk in model.generate_content(prompt, stream=True):
+        chunks.append(chunk.text)
+        if on_chunk is not None:
+            on_chunk(len(chunks))
+    bpy_code = ''.join(chunks).strip()
+    return bpy_code
@@ -1,12 +1,87 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tkinter import filedialog
 import customtkinter as ctk
 
+from engine.core import check_hardware_compatibility, generate_blender_code
+from blender.scene_generator import compile_videos, preview_scene, render_scene
+
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
+# Lines retained in the Rendering Logs panel
+LOG_PANEL_LINES = 500
+
+# Console echo of log messages is written by a daemon thread, so a slow or full
+# console never blocks the Tk loop
+_LOG_Q = queue.SimpleQueue()
+
+def _log_worker():
+    while True:
+        message = _LOG_Q.get()
+        if message is None:
+            break
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+_log_thread = threading.Thread(target=_log_worker, name="gui-log", daemon=True)
+_log_thread.start()
+
+@atexit.register
+def _drain_log():
+    _LOG_Q.put(None)
+    _log_thread.join(timeout=1.0)
+
+# Each render is a separate Blender process; cap how many run at once so their RAM use stays bounded
+MAX_PARALLEL_RENDERS = 4
+
+# Preview screenshots are scaled to fit the popup before they reach Tk
+PREVIEW_SIZE = (900, 500)
+
+# Scene script -> generated bpy code, so preview -> generate -> compile doesn't re-ask Gemini
+CODE_CACHE_SIZE = 128
+_code_cache = OrderedDict()
+
+# Render inputs -> output video, so re-compiling only re-renders scenes that changed
+RENDER_CACHE_SIZE = 128
+_render_cache = OrderedDict()
+
+# Both caches are used from the compile pool and the pipeline workers; the lock covers
+# lookup/insert/evict only, never the Gemini call or the render
+_cache_lock = threading.Lock()
+
+def _lru_get(cache, key):
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+def _lru_put(cache, key, value, size):
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > size:
+            cache.popitem(last=False)
+
+def _cached_generate(script, on_chunk=None):
+    """generate_blender_code memoized on the script text (LRU, CODE_CACHE_SIZE entries)."""
+    code = _lru_get(_code_cache, script)
+    if code is not None:
+        return code
+    code = generate_blender_code(script, on_chunk)
+    _lru_put(_code_cache, script, code, CODE_CACHE_SIZE)
+    return code
+
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -15,10 +90,6 @@ class App(ctk.CTk):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("green")  # Hacker-style green theme
 
-        # Hardware check
-        from engine.core import check_hardware_compatibility
-        check_hardware_compatibility()
-
         self.blender_path = ""
         self.audio_path = None
         self.use_ai_voice = False
@@ -26,6 +97,32 @@ class App(ctk.CTk):
         self.voice_volume = 1.0
         self.bgm_volume = 0.3
 
+        # Pipeline work runs on this pool; workers hand widget updates back through
+        # _ui_queue, which the Tk thread drains while polling their futures
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._ui_queue = queue.Queue()
+        # Log lines are batched into one textbox insert per idle cycle
+        self._pending_logs = deque(maxlen=256)
+        self._log_flush_scheduled = False
+        self._last_progress = 0.0
+        # Between compile_movie checkpoints the bar creeps toward the next one at a rate
+        # estimated from recent scene durations (see _progress_checkpoint)
+        self._progress_estimate = 0.0
+        self._progress_target = 0.0
+        self._progress_rate_per_sec = 0.0
+        self._progress_ticking = False
+        # id(scene textbox) -> stripped script text, see _get_script
+        self._script_cache = {}
+        # VoiceEngine / MotionCapture are built on first use and reused (see _get_voice_engine)
+        self._voice_engine = None
+        self._mocap = None
+        self._mocap_future = None
+        self._mocap_busy = False
+        self._engines_lock = threading.Lock()
+        # Preview / generate / compile run one at a time (see _start_pipeline): they share
+        # the pyttsx3 engine, which cannot run two synthesis loops at once
+        self._pipeline_future = None
+
         # Blender path selection frame
         blender_frame = ctk.CTkFrame(self)
         blender_frame.pack(pady=10, padx=10, fill="x")
@@ -69,13 +166,14 @@ class App(ctk.CTk):
         asset_frame.pack(pady=10, padx=10, fill="x")
         env_label = ctk.CTkLabel(asset_frame, text="Select Environment:")
         env_label.pack(side="left", padx=10)
-        from blender.assets_manager import get_available_environments, get_available_characters
-        self.env_combo = ctk.CTkComboBox(asset_frame, values=get_available_environments())
+        self.env_combo = ctk.CTkComboBox(asset_frame, values=[])
         self.env_combo.pack(side="left", padx=10)
         char_label = ctk.CTkLabel(asset_frame, text="Select Character:")
         char_label.pack(side="left", padx=10)
-        self.char_combo = ctk.CTkComboBox(asset_frame, values=get_available_characters())
+        self.char_combo = ctk.CTkComboBox(asset_frame, values=[])
         self.char_combo.pack(side="left", padx=10)
+        # assets_manager pulls in the GenAI client; load the lists after first paint
+        self.after(0, self._populate_assets)
 
         # Motion Capture frame
         mocap_frame = ctk.CTkFrame(self)
@@ -120,6 +218,74 @@ class App(ctk.CTk):
         self.generate_button.pack(side="left", padx=10)
         self.compile_button = ctk.CTkButton(button_frame, text="Compile Full Movie", fg_color="green", font=("Arial", 18, "bold"), command=self.compile_movie)
         self.compile_button.pack(side="right", padx=10)
+        self._pipeline_buttons = (self.preview_button, self.generate_button, self.compile_button)
+
+        # Hardware check; GPUtil shells out to nvidia-smi, so keep it off the first paint
+        self.after(100, self._run_in_background, self._run_hw_check)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _get_voice_engine(self):
+        # Workers and the Tk thread can both get here; build the engine only once
+        with self._engines_lock:
+            if self._voice_engine is None:
+                from audio.voice_engine import VoiceEngine
+                self._voice_engine = VoiceEngine()
+            return self._voice_engine
+
+    def _get_mocap(self):
+        # MotionCapture loads the MediaPipe pose graph, so keep one around between sessions
+        with self._engines_lock:
+            if self._mocap is None:
+                from ai.motion_capture import MotionCapture
+                self._mocap = MotionCapture(buffer_size=1)
+            return self._mocap
+
+    def _on_close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._mocap is not None:
+            # The pose graph may only be closed once no capture is using it
+            self._mocap.stop()
+            future = self._mocap_future
+            try:
+                if future is not None:
+                    future.result(timeout=5)
+                self._mocap.pose.close()
+            except Exception:
+                pass  # capture still stuck on the camera; the process is exiting anyway
+        self.destroy()
+
+    def _run_hw_check(self):
+        try:
+            check_hardware_compatibility()
+        except Exception as e:
+            self._post(self._log, f"HW check warning: {e}")
+
+    def _progress_checkpoint(self, reached, target, seconds):
+        """Jump to a known progress value and aim for target over roughly `seconds`."""
+        self._progress_estimate = max(self._progress_estimate, reached)
+        self._set_progress(self._progress_estimate)
+        self._progress_target = target
+        self._progress_rate_per_sec = (target - self._progress_estimate) / seconds if seconds > 0 else 0.0
+        if self._progress_rate_per_sec > 0 and not self._progress_ticking:
+            self._progress_ticking = True
+            self.after(100, self._tick_progress)
+
+    def _tick_progress(self):
+        if self._progress_rate_per_sec <= 0:
+            self._progress_ticking = False
+            return
+        self._progress_estimate = min(self._progress_target, self._progress_estimate + self._progress_rate_per_sec * 0.1)
+        self._set_progress(self._progress_estimate)
+        self.after(100, self._tick_progress)
+
+    def _populate_assets(self):
+        from blender.assets_manager import get_available_environments, get_available_characters
+        environments = get_available_environments()
+        characters = get_available_characters()
+        self.env_combo.configure(values=environments)
+        self.env_combo.set(environments[0])
+        self.char_combo.configure(values=characters)
+        self.char_combo.set(characters[0])
 
     def browse_blender(self):
         path = filedialog.askopenfilename(title="Select Blender Executable", filetypes=[("Executable", "*.exe")])
@@ -145,95 +311,190 @@ class App(ctk.CTk):
         self.bgm_volume = value
 
     def record_voice(self):
-        from audio.voice_engine import VoiceEngine
-        ve = VoiceEngine()
-        self.audio_path = ve.record_voice()
-        print(f"Voice recorded: {self.audio_path}")
+        self.audio_path = self._get_voice_engine().record_voice()
+        self._log(f"Voice recorded: {self.audio_path}")
 
     def start_mocap(self):
+        # One capture at a time: they would share the webcam and the MediaPipe graph
+        if self._mocap_busy:
+            return
+        self._mocap_busy = True
+        self.mocap_button.configure(state="disabled")
+        if sys.platform == "darwin":
+            # Cocoa only allows HighGUI windows on the main thread, so the UI waits
+            # for the capture here; Win32 and GTK/Qt windows work from a worker
+            self.update_idletasks()
+            self._mocap_finished(*self._capture_mocap())
+        else:
+            self._mocap_future = self._run_in_background(self._mocap_worker)
+
+    def _capture_mocap(self):
         try:
-            from ai.motion_capture import MotionCapture
-            mc = MotionCapture()
-            self.motion_capture_path = mc.capture_motion()
-            if self.motion_capture_path:
-                print(f"Motion capture saved: {self.motion_capture_path}")
+            return self._get_mocap().capture_motion(), None
         except Exception as e:
-            print(f"MoCap failed: {e}. Make sure webcam is available.")
+            return None, e
+
+    def _mocap_worker(self):
+        self._post(self._mocap_finished, *self._capture_mocap())
+
+    def _mocap_finished(self, path, error):
+        self._mocap_future = None
+        self._mocap_busy = False
+        self.mocap_button.configure(state="normal")
+        if error is not None:
+            self._log(f"MoCap failed: {error}. Make sure webcam is available.")
+        elif path:
+            self.motion_capture_path = path
+            self._log(f"Motion capture saved: {path}")
 
     def generate(self):
-        if not self.scenes:
+        if self._pipeline_future is not None or not self.scenes:
             return
-        script = self.scenes[0].get("1.0", "end").strip()
+        script = self._get_script(self.scenes[0])
         if not script or not self.blender_path:
             return
         if not self.use_ai_voice and self.audio_path is None:
             # Maybe show a message
-            print("Please record voice or enable AI voice")
+            self._log("Please record voice or enable AI voice")
             return
-        self.progress.set(0.2)
-        # Import and call AI processor
-        from engine.core import generate_blender_code
-        description = generate_blender_code(script)
-        self.progress.set(0.5)
-        if self.use_ai_voice:
-            from audio.voice_engine import VoiceEngine
-            ve = VoiceEngine()
-            self.audio_path = ve.generate_ai_voice(script)
-        # Import and call Blender scene generator
-        from blender.scene_generator import render_scene
+        self._set_progress(0.2)
+        # Widgets and settings are read here; workers only touch them through _post
         env_name = self.env_combo.get()
         char_name = self.char_combo.get()
+        self._start_pipeline(self._generate_worker, script, env_name, char_name, self.use_ai_voice, self.audio_path)
+
+    def _run_in_background(self, fn, *args):
+        future = self._executor.submit(fn, *args)
+        self.after(100, self._poll, future)
+        return future
+
+    def _start_pipeline(self, fn, *args):
+        # The buttons stay disabled until _poll sees this future finish
+        for button in self._pipeline_buttons:
+            button.configure(state="disabled")
+        self._pipeline_future = self._run_in_background(fn, *args)
+
+    def _pipeline_finished(self):
+        self._pipeline_future = None
+        for button in self._pipeline_buttons:
+            button.configure(state="normal")
+
+    def _post(self, func, *args):
+        # Safe to call from any thread; func runs on the Tk thread at the next poll
+        self._ui_queue.put((func, args))
+
+    def _poll(self, future):
+        # Sample done() before draining so updates posted just before the worker returns aren't missed
+        finished = future.done()
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            func(*args)
+        if not finished:
+            self.after(100, self._poll, future)
+            return
+        if future is self._pipeline_future:
+            self._pipeline_finished()
+        if future.exception() is not None:
+            self._log(f"Background task failed: {future.exception()}")
+
+    def _log(self, message):
+        # Tk thread only; workers go through self._post(self._log, ...)
+        _LOG_Q.put(message)
+        self._pending_logs.append(message + "\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after_idle(self._flush_logs)
+
+    def _flush_logs(self):
+        self._log_flush_scheduled = False
+        self.log_textbox.insert("end", "".join(self._pending_logs))
+        self._pending_logs.clear()
+        # Keep only the newest LOG_PANEL_LINES lines so long sessions don't slow redraws
+        line_count = int(self.log_textbox.index("end-1c").split(".")[0])
+        if line_count > LOG_PANEL_LINES:
+            self.log_textbox.delete("1.0", f"{line_count - LOG_PANEL_LINES + 1}.0")
+        self.log_textbox.see("end")
+
+    def _set_progress(self, value):
+        # Skip sub-2% moves so streaming updates don't force a redraw each time; always land on 1.0
+        if abs(value - self._last_progress) < 0.02 and value < 1.0:
+            return
+        self._last_progress = value
+        self.progress.set(value)
+
+    def _generate_worker(self, script, env_name, char_name, use_ai_voice, audio_path):
+        description, audio_path = self._describe_and_voice(script, use_ai_voice, audio_path)
+        self._post(self._set_progress, 0.5)
+        # Call Blender scene generator
         try:
-            output_file = render_scene(description, self.blender_path, self.audio_path, script, env_name, char_name, self.motion_capture_path, self.enable_bgm, self.voice_volume, self.bgm_volume)
+            output_file = render_scene(description, self.blender_path, audio_path, script, env_name, char_name, self.motion_capture_path, self.enable_bgm, self.voice_volume, self.bgm_volume)
         except Exception as e:
-            print(f"Rendering failed: {e}. Check Blender path and dependencies.")
+            self._post(self._log, f"Rendering failed: {e}. Check Blender path and dependencies.")
             return
-        self.progress.set(1.0)
+        self._post(self._set_progress, 1.0)
+
+    def _describe_and_voice(self, script, use_ai_voice, audio_path):
+        """Run the Gemini call and, if enabled, AI voice generation side by side; returns (description, audio_path)."""
+        if not use_ai_voice:
+            return _cached_generate(script, self._on_code_chunk), audio_path
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            description = pool.submit(_cached_generate, script, self._on_code_chunk)
+            voice = pool.submit(self._get_voice_engine().generate_ai_voice, script)
+            return description.result(), voice.result()
+
+    def _on_code_chunk(self, count):
+        # Called from a worker thread while Gemini streams; creep towards the 0.5 mark
+        self._post(self._set_progress, min(0.45, 0.2 + 0.25 * count / 50))
 
     def preview(self):
-        if not self.scenes:
+        if self._pipeline_future is not None or not self.scenes:
             return
-        script = self.scenes[0].get("1.0", "end").strip()
+        script = self._get_script(self.scenes[0])
         if not script or not self.blender_path:
             return
         if not self.use_ai_voice and self.audio_path is None:
-            print("Please record voice or enable AI voice")
+            self._log("Please record voice or enable AI voice")
             return
-        self.progress.set(0.2)
-        # Import and call AI processor
-        from engine.core import generate_blender_code
-        description = generate_blender_code(script)
-        self.progress.set(0.5)
-        if self.use_ai_voice:
-            from audio.voice_engine import VoiceEngine
-            ve = VoiceEngine()
-            self.audio_path = ve.generate_ai_voice(script)
-        self.progress.set(0.8)
-        # Import and call Blender scene preview
-        from blender.scene_generator import preview_scene
+        self._set_progress(0.2)
         env_name = self.env_combo.get()
         char_name = self.char_combo.get()
+        self._start_pipeline(self._preview_worker, script, env_name, char_name, self.use_ai_voice, self.audio_path)
+
+    def _preview_worker(self, script, env_name, char_name, use_ai_voice, audio_path):
+        description, audio_path = self._describe_and_voice(script, use_ai_voice, audio_path)
+        self._post(self._set_progress, 0.8)
+        # Call Blender scene preview
         try:
-            screenshot_path = preview_scene(description, self.blender_path, self.audio_path, script, env_name, char_name, self.motion_capture_path, self.enable_bgm, self.voice_volume, self.bgm_volume)
+            screenshot_path = preview_scene(description, self.blender_path, audio_path, script, env_name, char_name, self.motion_capture_path, self.enable_bgm, self.voice_volume, self.bgm_volume)
         except Exception as e:
-            print(f"Preview failed: {e}. Check Blender path.")
+            self._post(self._log, f"Preview failed: {e}. Check Blender path.")
             return
-        self.progress.set(1.0)
+        self._post(self._set_progress, 1.0)
+        self._post(self._show_preview, screenshot_path)
+
+    def _show_preview(self, screenshot_path):
         # Show preview in popup
         if PIL_AVAILABLE and screenshot_path:
             try:
                 image = Image.open(screenshot_path)
-                photo = ImageTk.PhotoImage(image)
+                # JPEG decodes straight at reduced size; for PNG draft is a no-op and thumbnail does the work
+                image.draft('RGB', PREVIEW_SIZE)
+                image.thumbnail(PREVIEW_SIZE, Image.Resampling.BILINEAR)
+                # CTkImage handles HiDPI scaling itself, so hand it the bitmap at display size
+                photo = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
                 popup = ctk.CTkToplevel(self)
                 popup.title("Scene Preview")
-                popup.geometry("900x500")
+                popup.geometry(f"{PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]}")
                 label = ctk.CTkLabel(popup, image=photo, text="")
                 label.pack()
                 label.image = photo  # Keep reference
             except Exception as e:
-                print(f"Error showing preview: {e}")
+                self._log(f"Error showing preview: {e}")
         else:
-            print("PIL not available or no screenshot generated")
+            self._log("PIL not available or no screenshot generated")
 
     def add_scene(self):
         scene_num = len(self.scenes) + 1
@@ -250,42 +511,75 @@ class App(ctk.CTk):
     def remove_scene(self, frame, textbox):
         frame.destroy()
         self.scenes.remove(textbox)
+        self._script_cache.pop(id(textbox), None)
+
+    def _get_script(self, textbox):
+        # Re-read the Tk text only after an edit; the modified flag is reset on each read
+        key = id(textbox)
+        if key not in self._script_cache or textbox.edit_modified():
+            self._script_cache[key] = textbox.get("1.0", "end").strip()
+            textbox.edit_modified(False)
+        return self._script_cache[key]
 
     def compile_movie(self):
-        if not self.scenes or not self.blender_path:
+        if self._pipeline_future is not None or not self.scenes or not self.blender_path:
             return
-        self.progress.set(0.1)
-        from ai.processor import process_script
-        scenes_data = []
-        for textbox in self.scenes:
-            script = textbox.get("1.0", "end").strip()
-            if script:
-                from engine.core import generate_blender_code
-                description = generate_blender_code(script)
-                scenes_data.append((description, script))
-        if not scenes_data:
+        scripts = [self._get_script(textbox) for textbox in self.scenes]
+        scripts = [script for script in scripts if script]
+        if not scripts:
             return
-        self.progress.set(0.3)
-        # Render each scene
-        temp_videos = []
-        for i, (description, script) in enumerate(scenes_data):
-            from blender.scene_generator import render_scene
-            try:
-                output_file = render_scene(description, self.blender_path, None, script, self.env_combo.get(), self.char_combo.get(), self.motion_capture_path, self.enable_bgm, self.voice_volume, self.bgm_volume)
-                temp_videos.append(output_file)
-            except Exception as e:
-                print(f"Rendering scene {i+1} failed: {e}")
-                continue
-            self.progress.set(0.3 + 0.4 * (i+1) / len(scenes_data))
+        self._progress_estimate = 0.0
+        self._set_progress(0.1)
+        self._start_pipeline(self._compile_worker, scripts, self.env_combo.get(), self.char_combo.get())
+
+    def _compile_worker(self, scripts, env_name, char_name):
+        # Each scene generates its code and renders independently, so one scene's
+        # Gemini call overlaps another's Blender run. A private pool is used because
+        # waiting on self._executor from one of its own workers could starve it.
+        jobs = [(i, script, self.blender_path, env_name, char_name, self.motion_capture_path, self.enable_bgm, self.voice_volume, self.bgm_volume)
+                for i, script in enumerate(scripts)]
+        rendered = {}
+        last_done = time.monotonic()
+        scene_seconds = None  # EMA of the gap between completed scenes
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1, MAX_PARALLEL_RENDERS)) as pool:
+            futures = [pool.submit(_render_one, job) for job in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                i, result = future.result()
+                if isinstance(result, Exception):
+                    self._post(self._log, f"Rendering scene {i+1} failed: {result}")
+                else:
+                    rendered[i] = result
+                now = time.monotonic()
+                elapsed, last_done = now - last_done, now
+                scene_seconds = elapsed if scene_seconds is None else 0.7 * scene_seconds + 0.3 * elapsed
+                reached = 0.1 + 0.6 * done / len(jobs)
+                target = 0.1 + 0.6 * min(done + 1, len(jobs)) / len(jobs)
+                self._post(self._progress_checkpoint, reached, target, scene_seconds)
+        temp_videos = [rendered[i] for i in sorted(rendered)]
         if not temp_videos:
-            print("No scenes rendered successfully.")
+            self._post(self._log, "No scenes rendered successfully.")
             return
         # Compile videos
-        from blender.scene_generator import compile_videos
         try:
             final_output = compile_videos(temp_videos, self.blender_path)
         except Exception as e:
-            print(f"Compiling movie failed: {e}")
+            self._post(self._log, f"Compiling movie failed: {e}")
             return
-        self.progress.set(1.0)
-        print(f"Full movie compiled: {final_output}")
\ No newline at end of file
+        self._post(self._set_progress, 1.0)
+        self._post(self._log, f"Full movie compiled: {final_output}")
+
+
+def _render_one(job):
+    """Generate and render one scene; returns (index, output_file or the exception raised)."""
+    i, script, blender_path, env_name, char_name, motion_capture_path, enable_bgm, voice_volume, bgm_volume = job
+    key = job[1:]
+    output_file = _lru_get(_render_cache, key)
+    if output_file and os.path.exists(output_file):
+        return i, output_file
+    try:
+        description = _cached_generate(script)
+        output_file = render_scene(description, blender_path, None, script, env_name, char_name, motion_capture_path, enable_bgm, voice_volume, bgm_volume)
+    except Exception as e:
+        return i, e
+    _lru_put(_render_cache, key, output_file, RENDER_CACHE_SIZE)
+    return i, output_file
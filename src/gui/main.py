@@ -1,11 +1,23 @@
 import customtkinter as ctk
 import os
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Set dark theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
+# Shared font specs (plain tuples: a CTkFont can't be built before the root window exists)
+FONT_HEADER = ("Courier", 24, "bold")
+FONT_BUTTON = ("Courier", 16)
+FONT_LABEL = ("Courier", 14)
+FONT_BODY = ("Courier", 12)
+FONT_MONO_SMALL = ("Courier", 10)
+
+# <project root>/output
+_OUTPUT_DIR = Path(__file__).resolve().parents[2] / "output"
+
 class SrijanEngineApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -13,25 +25,25 @@ class SrijanEngineApp(ctk.CTk):
         self.geometry("900x700")
 
         # Header
-        self.header = ctk.CTkLabel(self, text="Srijan Engine", font=("Courier", 24, "bold"))
+        self.header = ctk.CTkLabel(self, text="Srijan Engine", font=FONT_HEADER)
         self.header.pack(pady=20)
 
         # Script input
-        self.script_label = ctk.CTkLabel(self, text="Enter your script:", font=("Courier", 14))
+        self.script_label = ctk.CTkLabel(self, text="Enter your script:", font=FONT_LABEL)
         self.script_label.pack(pady=5)
-        self.script_textbox = ctk.CTkTextbox(self, width=800, height=300, font=("Courier", 12))
+        self.script_textbox = ctk.CTkTextbox(self, width=800, height=300, font=FONT_BODY)
         self.script_textbox.pack(pady=10)
 
         # Generate button
-        self.generate_button = ctk.CTkButton(self, text="Generate Movie", command=self.generate_movie, font=("Courier", 16))
+        self.generate_button = ctk.CTkButton(self, text="Generate Movie", command=self.generate_movie, font=FONT_BUTTON)
         self.generate_button.pack(pady=20)
 
         # Status label
-        self.status_label = ctk.CTkLabel(self, text="Ready", font=("Courier", 12))
+        self.status_label = ctk.CTkLabel(self, text="Ready", font=FONT_BODY)
         self.status_label.pack(pady=10)
 
         # Processing log label
-        self.processing_log_label = ctk.CTkLabel(self, text="", font=("Courier", 10), text_color="gray")
+        self.processing_log_label = ctk.CTkLabel(self, text="", font=FONT_MONO_SMALL, text_color="gray")
         self.processing_log_label.pack(pady=5)
 
     def generate_movie(self):
@@ -54,47 +66,30 @@ class SrijanEngineApp(ctk.CTk):
             self.status_label.configure(text=f"Error parsing script: {str(e)}")
             return
 
-        self.status_label.configure(text="Generating 3D scene with Blender...")
-        try:
-            # Call Blender to render the scene
-            from src.blender.scene_generator import SceneGenerator
-            from src.blender.renderer import BlenderRenderer
-            
-            generator = SceneGenerator()
-            renderer = BlenderRenderer()
-            
-            # Generate scene based on parsed config
-            blend_file = generator.create_scene_from_config(scene_config)
-            
-            # Render to video frames
-            output_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                'output'
-            )
-            os.makedirs(output_dir, exist_ok=True)
-            
-            rendered_video = renderer.render_to_video(blend_file, output_dir, fps=30)
-            self.processing_log_label.configure(text=f"✓ Rendered video: {os.path.basename(rendered_video)}")
-            
-        except ImportError:
-            self.status_label.configure(text="Blender not configured. Continuing with audio generation...")
-            rendered_video = None
-        except Exception as e:
-            self.status_label.configure(text=f"Blender rendering error: {str(e)}")
-            rendered_video = None
-
-        self.status_label.configure(text="Generating AI narration...")
-        try:
-            # Generate emotional voice narration
-            from src.audio.emotional_voice_engine import EmotionalVoiceEngine
-            
-            engine = EmotionalVoiceEngine()
-            narration_audio = engine.generate_emotional_voice(script[:500], emotion="happy")
-            self.processing_log_label.configure(text=f"✓ Generated narration: {os.path.basename(narration_audio)}")
-            
-        except Exception as e:
-            self.status_label.configure(text=f"Narration error: {str(e)}")
-            narration_audio = None
+        output_dir = str(_OUTPUT_DIR)
+
+        # Rendering and narration don't depend on each other, so run them side by side
+        self.status_label.configure(text="Generating 3D scene and AI narration...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            render_future = pool.submit(self._render_scene, scene_config, output_dir)
+            narration_future = pool.submit(self._generate_narration, script)
+
+            try:
+                rendered_video = render_future.result()
+                self.processing_log_label.configure(text=f"✓ Rendered video: {os.path.basename(rendered_video)}")
+            except ImportError:
+                self.status_label.configure(text="Blender not configured. Continuing with audio generation...")
+                rendered_video = None
+            except Exception as e:
+                self.status_label.configure(text=f"Blender rendering error: {str(e)}")
+                rendered_video = None
+
+            try:
+                narration_audio = narration_future.result()
+                self.processing_log_label.configure(text=f"✓ Generated narration: {os.path.basename(narration_audio)}")
+            except Exception as e:
+                self.status_label.configure(text=f"Narration error: {str(e)}")
+                narration_audio = None
 
         self.status_label.configure(text="Applying VFX and audio effects...")
         try:
@@ -106,7 +101,7 @@ class SrijanEngineApp(ctk.CTk):
                 
                 # Add audio effects
                 merger.add_audio_track(narration_audio, "Narration", volume=1.0)
-                mixed_audio = merger.mix_audio_tracks(os.path.join(output_dir, "final_audio.wav"))
+                mixed_audio = merger.mix_audio_tracks(str(_OUTPUT_DIR / "final_audio.wav"))
                 
                 # Apply visual effects
                 merger.add_visual_effect('color_grade', 0.7, 0, 9999, {'color_temp': 'warm'})
@@ -114,14 +109,14 @@ class SrijanEngineApp(ctk.CTk):
                 
                 final_video = merger.process_video_with_effects(
                     rendered_video,
-                    os.path.join(output_dir, f"movie_with_vfx_{datetime.now().timestamp()}.mp4")
+                    str(_OUTPUT_DIR / f"movie_with_vfx_{time.time_ns()}.mp4")
                 )
                 
                 # Merge video and audio
                 final_output = merger.merge_video_and_audio(
                     final_video,
                     mixed_audio,
-                    os.path.join(output_dir, f"movie_final_{datetime.now().timestamp()}.mp4")
+                    str(_OUTPUT_DIR / f"movie_final_{time.time_ns()}.mp4")
                 )
                 
                 self.processing_log_label.configure(text=f"✓ Final video: {os.path.basename(final_output)}")
@@ -131,6 +126,29 @@ class SrijanEngineApp(ctk.CTk):
 
         self.status_label.configure(text="Movie generated successfully! Check output folder.")
 
+    def _render_scene(self, scene_config, output_dir):
+        """Build the .blend for scene_config and render it to video (runs on a worker thread)."""
+        # Call Blender to render the scene
+        from src.blender.scene_generator import SceneGenerator
+        from src.blender.renderer import BlenderRenderer
+        
+        generator = SceneGenerator()
+        renderer = BlenderRenderer()
+        
+        # Generate scene based on parsed config
+        blend_file = generator.create_scene_from_config(scene_config)
+        
+        # Render to video frames
+        os.makedirs(output_dir, exist_ok=True)
+        return renderer.render_to_video(blend_file, output_dir, fps=30)
+
+    def _generate_narration(self, script):
+        """Generate the emotional voice narration (runs on a worker thread)."""
+        from src.audio.emotional_voice_engine import EmotionalVoiceEngine
+        
+        engine = EmotionalVoiceEngine()
+        return engine.generate_emotional_voice(script[:500], emotion="happy")
+
     def _create_default_scene_config(self, script):
         """Create a default scene configuration from script text."""
         return {
@@ -5,6 +5,7 @@ Demonstrates how to use the new audio-visual modules together.
 
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Configure logging
@@ -27,7 +28,7 @@ def example_audio_processing():
     from audio.lip_sync_engine import LipSyncEngine
     
     # Initialize engines
-    voice_engine = EmotionalVoiceEngine()
+    voice_engine = EmotionalVoiceEngine(fast=True)
     lipsync_engine = LipSyncEngine()
     
     # Generate emotional voice
@@ -36,16 +37,15 @@ def example_audio_processing():
     # Generate with different emotions
     emotions_to_try = ['happy', 'neutral', 'concerned']
     
-    for emotion in emotions_to_try:
-        try:
-            audio_path = voice_engine.generate_emotional_voice(
-                text=text,
-                emotion=emotion,
-                filename=f"warehouse_welcome_{emotion}.wav"
-            )
-            logger.info(f"Generated emotional voice: {emotion}")
-        except Exception as e:
-            logger.error(f"Error generating voice for {emotion}: {e}")
+    try:
+        audio_paths = voice_engine.generate_emotional_voice_batch(
+            text=text,
+            emotions=emotions_to_try,
+            filenames=[f"warehouse_welcome_{emotion}.wav" for emotion in emotions_to_try]
+        )
+        logger.info(f"Generated emotional voices: {', '.join(emotions_to_try)}")
+    except Exception as e:
+        logger.error(f"Error generating voices for {emotions_to_try}: {e}")
     
     # Get available options
     logger.info(f"Available emotions: {voice_engine.get_available_emotions()}")
@@ -67,7 +67,7 @@ def example_audio_visual_merge():
     merger = AudioVisualMerger()
     
     # Generate voice track
-    voice_engine = EmotionalVoiceEngine()
+    voice_engine = EmotionalVoiceEngine(fast=True)
     voice_path = voice_engine.generate_emotional_voice(
         text="This is the main narration for the warehouse tour.",
         emotion="neutral",
@@ -199,30 +199,12 @@ def example_warehouse_inventory():
         )
         
         # Add assets to scene
-        assets_manager.add_asset_to_scene(
-            scene_id="loading_dock_001",
-            asset_id="container_truck_001",
-            position=(0, 0, 0)
-        )
-        
-        assets_manager.add_asset_to_scene(
-            scene_id="loading_dock_001",
-            asset_id="forklift_001",
-            position=(5, 0, 0)
-        )
-        
-        assets_manager.add_asset_to_scene(
-            scene_id="loading_dock_001",
-            asset_id="medicine_box_001",
-            position=(3, 2, 0),
-            scale=(1.5, 1.5, 1.5)
-        )
-        
-        assets_manager.add_asset_to_scene(
-            scene_id="loading_dock_001",
-            asset_id="warehouse_shelf_001",
-            position=(-5, 0, 0)
-        )
+        assets_manager.add_assets_to_scene("loading_dock_001", [
+            {'asset_id': "container_truck_001", 'position': (0, 0, 0)},
+            {'asset_id': "forklift_001", 'position': (5, 0, 0)},
+            {'asset_id': "medicine_box_001", 'position': (3, 2, 0), 'scale': (1.5, 1.5, 1.5)},
+            {'asset_id': "warehouse_shelf_001", 'position': (-5, 0, 0)},
+        ])
         
         logger.info("Scene created with 4 assets")
         
@@ -271,14 +253,16 @@ def example_complete_workflow():
         )
         
         # Add warehouse assets
-        for asset_id in ["container_truck_001", "forklift_001", "warehouse_shelf_001"]:
-            assets_manager.add_asset_to_scene("full_tour_001", asset_id)
+        assets_manager.add_assets_to_scene("full_tour_001", [
+            {'asset_id': asset_id}
+            for asset_id in ["container_truck_001", "forklift_001", "warehouse_shelf_001"]
+        ])
         
         logger.info("Scene setup complete")
         
         # Step 2: Generate narration with emotions
         logger.info("\nStep 2: Generating narration...")
-        voice_engine = EmotionalVoiceEngine()
+        voice_engine = EmotionalVoiceEngine(fast=True)
         
         narration = voice_engine.generate_emotional_voice(
             text="Welcome to the Saipooja Warehouse management system. We maintain a fleet of container trucks and forklifts for efficient logistics.",
@@ -354,12 +338,22 @@ if __name__ == "__main__":
     logger.info("Srijan Engine Advanced Audio-Visual Features Demo")
     logger.info("=" * 60)
     
-    # Run examples
+    # Run examples; the first four are independent of each other
     try:
-        example_audio_processing()
-        example_audio_visual_merge()
-        example_vfx_processing()
-        example_warehouse_inventory()
+        # TTS examples get their own processes (pyttsx3 engines are not thread-safe),
+        # the script/config writers only do file I/O and share a thread pool
+        with ProcessPoolExecutor(max_workers=2) as processes, ThreadPoolExecutor(max_workers=2) as threads:
+            futures = [
+                processes.submit(example_audio_processing),
+                processes.submit(example_audio_visual_merge),
+                threads.submit(example_vfx_processing),
+                threads.submit(example_warehouse_inventory),
+            ]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    logger.error(f"Example failed: {future.exception()}")
+        
+        # The combined workflow exercises all modules again, so run it once the rest are done
         example_complete_workflow()
         
     except Exception as e:
@@ -6,6 +6,7 @@ Tests: Script parsing, Audio generation, Video rendering, Audio-visual merging
 import os
 import sys
 from pathlib import Path
+from unittest import mock
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -33,6 +34,15 @@ def test_script_processor():
         for i, scene in enumerate(config.get('scenes', []), 1):
             print(f"    - Scene {i}: {scene.get('camera', {}).get('angle')} camera, {scene.get('lighting')} lighting")
         
+        # Re-parsing the same script is served from the parse cache, without parsing
+        def not_cached(*args, **kwargs):
+            raise AssertionError("second parse missed the cache")
+        with mock.patch.object(ScriptProcessor, '_parse_paragraph_to_scene', not_cached):
+            cached_processor = ScriptProcessor()
+            assert cached_processor.parse_script_to_scenes(script) == config
+        assert cached_processor.scenes[0] is not processor.scenes[0]
+        print(f"  ✓ Second parse served from cache")
+        
         return True
     except Exception as e:
         print(f"  ✗ Error: {e}")
@@ -47,7 +57,7 @@ def test_emotional_voice_engine():
     try:
         from src.audio.emotional_voice_engine import EmotionalVoiceEngine
         
-        engine = EmotionalVoiceEngine()
+        engine = EmotionalVoiceEngine(fast=True)
         
         # Test voice generation
         text = "Welcome to the warehouse management system."
@@ -102,6 +112,17 @@ def test_blender_renderer():
         print(f"  ✓ Blender path: {renderer.blender_path}")
         print(f"  ✓ Temp directory: {renderer.temp_dir}")
         
+        # Chunk splitting for render_parallel covers the range contiguously, sizes within one frame
+        ranges = BlenderRenderer._split_frame_range(1, 150, 4)
+        assert ranges == [(1, 38), (39, 76), (77, 113), (114, 150)]
+        assert BlenderRenderer._split_frame_range(10, 10, 1) == [(10, 10)]
+        try:
+            renderer.render_parallel("scene.blend", "out.mp4", 20, 10)
+            raise AssertionError("reversed frame range was accepted")
+        except ValueError:
+            pass
+        print(f"  ✓ Frame range split into {len(ranges)} chunks")
+        
         # Check if Blender is available
         import subprocess
         try:
@@ -168,7 +189,7 @@ def test_complete_flow():
         
         # Step 2: Generate narration
         print("  → Step 2: Generate narration...")
-        engine = EmotionalVoiceEngine()
+        engine = EmotionalVoiceEngine(fast=True)
         audio = engine.generate_emotional_voice(script, emotion="happy")
         print(f"    ✓ Generated audio")
         